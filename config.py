@@ -17,15 +17,30 @@ CAMERA_WIDTH: int = 640
 CAMERA_HEIGHT: int = 480
 CAMERA_FPS: int = 30
 
-# CSIカメラ用GStreamerパイプライン
+# CSIカメラからグレースケールで取得する (カスケード・dlibはグレースケールのみ使用.
+# YuNetはカラー画像を使うため、DETECTOR="yunet"の場合はこの設定によらずBGRで取得する)
+CAMERA_OUTPUT_GRAY: bool = True
+
+# CSIカメラ用GStreamerパイプライン (nvvidconvでGRAY8に変換し、CPUでの色変換を省く)
+# appsinkは最新の1フレームのみ保持し、クロック同期を待たずに渡す (遅延を1フレーム以内に抑える)
 GSTREAMER_PIPELINE: str = (
+    f"nvarguscamerasrc ! "
+    f"video/x-raw(memory:NVMM), width={CAMERA_WIDTH}, height={CAMERA_HEIGHT}, "
+    f"format=(string)NV12, framerate={CAMERA_FPS}/1 ! "
+    f"nvvidconv flip-method=0 ! "
+    f"video/x-raw, width={CAMERA_WIDTH}, height={CAMERA_HEIGHT}, format=(string)GRAY8 ! "
+    f"appsink drop=1 max-buffers=1 sync=false"
+)
+
+# CSIカメラ用GStreamerパイプライン (カラー映像が必要な場合)
+# videoconvertを使わずBGRxのまま受け取り、Camera.readでアルファを除いたビューを返す
+GSTREAMER_PIPELINE_BGR: str = (
     f"nvarguscamerasrc ! "
     f"video/x-raw(memory:NVMM), width={CAMERA_WIDTH}, height={CAMERA_HEIGHT}, "
     f"format=(string)NV12, framerate={CAMERA_FPS}/1 ! "
     f"nvvidconv flip-method=0 ! "
     f"video/x-raw, width={CAMERA_WIDTH}, height={CAMERA_HEIGHT}, format=(string)BGRx ! "
-    f"videoconvert ! "
-    f"video/x-raw, format=(string)BGR ! appsink"
+    f"appsink drop=1 max-buffers=1 sync=false"
 )
 
 # =============================================================================
@@ -47,6 +62,9 @@ SERVO_TILT_CENTER: int = 90
 # PWM設定
 PWM_FREQUENCY: int = 50  # Hz (標準的なサーボは50Hz)
 
+# これ未満の角度変化ではPWMを書き換えない (SG90の分解能以下)
+SERVO_MIN_STEP: float = 0.5  # 度
+
 # =============================================================================
 # 追尾設定
 # =============================================================================
@@ -54,6 +72,7 @@ PWM_FREQUENCY: int = 50  # Hz (標準的なサーボは50Hz)
 PID_KP: float = 0.5  # 比例ゲイン
 PID_KI: float = 0.0  # 積分ゲイン
 PID_KD: float = 0.1  # 微分ゲイン
+PID_OUTPUT_LIMIT: float = 30.0  # 1回の制御出力の上限 (度)
 
 # デッドゾーン（この範囲内では動作しない）
 DEADZONE_X: int = 30  # ピクセル
@@ -65,10 +84,52 @@ SMOOTHING_FACTOR: float = 0.3
 # =============================================================================
 # 顔検出設定
 # =============================================================================
+# 顔検出器の種類 ("cascade": LBP/Haarカスケード, "yunet": OpenCV DNNのYuNet, "dlib": dlibのHOG)
+DETECTOR: str = "cascade"
+
 # 検出モデルパス
 FACE_CASCADE_PATH: str = "/usr/share/opencv4/haarcascades/haarcascade_frontalface_default.xml"
 
+# LBPカスケードを優先して使用する (Haarより高速。見つからなければHaarを使用)
+USE_LBP: bool = True
+LBP_CASCADE_PATH: str = "/usr/share/opencv4/lbpcascades/lbpcascade_frontalface_improved.xml"
+
+# CUDA対応OpenCVでGPUが使える場合はGPUで検出する (使えなければCPU)
+DETECTION_USE_CUDA: bool = True
+
 # 検出パラメータ
-DETECTION_SCALE_FACTOR: float = 1.1
+DETECTION_SCALE_FACTOR: float = 1.2
 DETECTION_MIN_NEIGHBORS: int = 5
 DETECTION_MIN_SIZE: tuple[int, int] = (30, 30)
+DETECTION_MAX_SIZE: tuple[int, int] = (300, 300)  # これより大きい顔は探索しない
+
+# 検出前の縮小率 (2.0なら縦横1/2の画像で検出、1.0で縮小なし)
+DETECTION_DOWNSCALE: float = 2.0
+
+# 顔検出を行うフレーム間隔 (2なら2フレームに1回、間のフレームは直前の結果を使う)
+DETECTION_STRIDE: int = 2
+
+# 追尾中は前回の顔の周辺のみ探索する (余白は顔の幅・高さに対する比率)
+ROI_MARGIN: float = 1.0
+# 周辺探索でこの回数連続して見つからなければ全画面探索に戻る
+ROI_MAX_MISSES: int = 5
+
+# YuNet (DETECTOR = "yunet" の場合)
+YUNET_MODEL_PATH: str = str(PROJECT_ROOT / "models" / "face_detection_yunet_2023mar.onnx")
+YUNET_SCORE_THRESHOLD: float = 0.9
+YUNET_NMS_THRESHOLD: float = 0.3
+YUNET_TOP_K: int = 5000
+
+# dlib (DETECTOR = "dlib" の場合)
+# 検出前に画像を拡大する回数 (0で拡大なし. 1にすると小さい顔も検出できるが約4倍遅い)
+DLIB_UPSAMPLE: int = 0
+
+# =============================================================================
+# スレッド・CPU設定
+# =============================================================================
+# OpenCV内部の並列処理のスレッド数
+OPENCV_NUM_THREADS: int = 2
+
+# 顔検出スレッドを固定するCPUコア (Jetson NanoのCortex-A57 4コア. Noneで固定しない)
+# コア0はキャプチャ・サーボ制御 (メインスレッド) 用に空けておく
+DETECTOR_CPU_AFFINITY: tuple[int, ...] | None = (1, 2, 3)
@@ -1,8 +1,17 @@
 """Jetson Nano Face Tracking System."""
 
 from src.camera import Camera
-from src.face_detector import FaceDetector
+from src.face_detector import FaceDetector, FaceDetectorDlib, FaceDetectorYuNet
 from src.servo_controller import ServoController
+from src.threaded_detector import ThreadedDetector
 from src.tracker import FaceTracker
 
-__all__ = ["Camera", "FaceDetector", "FaceTracker", "ServoController"]
+__all__ = [
+    "Camera",
+    "FaceDetector",
+    "FaceDetectorDlib",
+    "FaceDetectorYuNet",
+    "FaceTracker",
+    "ServoController",
+    "ThreadedDetector",
+]
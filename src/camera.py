@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import config
 import cv2
@@ -19,13 +19,16 @@ logger = get_logger(__name__)
 class Camera:
     """CSIカメラからフレームを取得するクラス."""
 
-    def __init__(self, use_csi: bool = True) -> None:
+    def __init__(self, use_csi: bool = True, output_gray: bool | None = None) -> None:
         """カメラを初期化.
 
         Args:
             use_csi: CSIカメラを使用する場合True、USBカメラはFalse
+            output_gray: CSIカメラからグレースケールで取得する場合True
+                (Noneの場合はconfigの値)
         """
         self.use_csi = use_csi
+        self.output_gray = output_gray if output_gray is not None else config.CAMERA_OUTPUT_GRAY
         self.cap: cv2.VideoCapture | None = None
         self.width = config.CAMERA_WIDTH
         self.height = config.CAMERA_HEIGHT
@@ -35,7 +38,10 @@ class Camera:
         if self.use_csi:
             # CSIカメラ (GStreamerパイプライン使用)
             logger.info("CSIカメラを初期化中 (GStreamer)...")
-            self.cap = cv2.VideoCapture(config.GSTREAMER_PIPELINE, cv2.CAP_GSTREAMER)
+            pipeline = (
+                config.GSTREAMER_PIPELINE if self.output_gray else config.GSTREAMER_PIPELINE_BGR
+            )
+            self.cap = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
         else:
             # USBカメラ
             logger.info("USBカメラを初期化中...")
@@ -43,6 +49,8 @@ class Camera:
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
             self.cap.set(cv2.CAP_PROP_FPS, config.CAMERA_FPS)
+            # ドライバ側のバッファを1枚にし、古いフレームが溜まらないようにする
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         if not self.cap.isOpened():
             msg = "カメラを開けませんでした"
@@ -55,13 +63,34 @@ class Camera:
     def read(self) -> tuple[bool, NDArray[np.uint8] | None]:
         """フレームを取得.
 
+        CSIカメラでoutput_grayが有効な場合はグレースケール、それ以外はBGR画像を返す.
+
         Returns:
             tuple: (成功フラグ, フレーム画像)
         """
         if self.cap is None:
             return False, None
         ret, frame = self.cap.read()
-        return ret, frame if ret else None
+        if not ret:
+            return False, None
+        if frame.ndim == 3 and frame.shape[2] == 4:
+            # BGRx -> BGR (コピーせずビューでアルファを除く)
+            frame = frame[:, :, :3]
+        return ret, frame
+
+    def read_gray(self) -> tuple[bool, NDArray[np.uint8] | None]:
+        """グレースケールのフレームを取得.
+
+        Returns:
+            tuple: (成功フラグ, 1チャンネルのフレーム画像)
+        """
+        ret, frame = self.read()
+        if frame is None:
+            return False, None
+        if frame.ndim == 3:
+            # USBカメラなどBGRで取得した場合のみCPUで変換
+            frame = cast("NDArray[np.uint8]", cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+        return ret, frame
 
     def get_center(self) -> tuple[int, int]:
         """画面中心座標を取得."""
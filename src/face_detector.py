@@ -1,8 +1,10 @@
-"""顔検出モジュール - OpenCV Haar Cascadeを使用した顔検出."""
+"""顔検出モジュール - OpenCVのカスケード分類器 (LBP/Haar)、YuNetまたはdlibを使用した顔検出."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import config
 import cv2
@@ -18,69 +20,173 @@ FaceRect = tuple[int, int, int, int]
 
 logger = get_logger(__name__)
 
+# dlib (HOG顔検出器) はオプション
+try:
+    import dlib
 
-class FaceDetector:
-    """Haar Cascadeベースの顔検出クラス."""
+    DLIB_AVAILABLE = True
+except ImportError:
+    dlib: Any = None  # type: ignore[no-redef]
+    DLIB_AVAILABLE = False
 
-    def __init__(self) -> None:
-        """顔検出器を初期化."""
-        self.face_cascade = cv2.CascadeClassifier(config.FACE_CASCADE_PATH)
+# 読み込み済みカスケードのキャッシュ (パス -> 分類器). XMLの再パースを避ける
+_CASCADE_CACHE: dict[str, cv2.CascadeClassifier] = {}
 
-        # カスケードファイルが読み込めない場合はOpenCVのデフォルトを試す
-        if self.face_cascade.empty():
+
+def _load_cascade(path: str) -> cv2.CascadeClassifier | None:
+    """カスケードを読み込む (読み込み済みならキャッシュを返す).
+
+    Args:
+        path: カスケードファイルのパス
+
+    Returns:
+        cv2.CascadeClassifier: 読み込めなかった場合はNone
+    """
+    cascade = _CASCADE_CACHE.get(path)
+    if cascade is None:
+        # 存在しないファイルはOpenCVに渡さない (OpenCVがエラーログを出すため)
+        if not Path(path).is_file():
+            return None
+        cascade = cv2.CascadeClassifier(path)
+        if cascade.empty():
+            return None
+        _CASCADE_CACHE[path] = cascade
+    return cascade
+
+
+def _cuda_available() -> bool:
+    """OpenCVからCUDAデバイスが使えるかどうか."""
+    return hasattr(cv2, "cuda") and cv2.cuda.getCudaEnabledDeviceCount() > 0
+
+
+def _cascade_candidates() -> list[str]:
+    """読み込みを試すカスケードファイルのパスを優先順に返す (最後はOpenCV同梱のHaar)."""
+    candidates = []
+    if config.USE_LBP:
+        candidates.append(config.LBP_CASCADE_PATH)
+    candidates += [
+        config.FACE_CASCADE_PATH,
+        cv2.data.haarcascades + "haarcascade_frontalface_default.xml",
+    ]
+    return candidates
+
+
+def _find_cascade() -> tuple[str, cv2.CascadeClassifier] | None:
+    """LBP -> Haar -> OpenCV同梱のHaarの順に、読み込めた最初のカスケードを返す.
+
+    Returns:
+        tuple: (読み込んだファイルのパス, 分類器). どれも読み込めなかった場合はNone
+    """
+    candidates = _cascade_candidates()
+    for path in candidates:
+        cascade = _load_cascade(path)
+        if cascade is None:
+            logger.debug("カスケードファイルが見つかりません: %s. 次の候補を試行します.", path)
+            continue
+        if path == candidates[-1]:
             logger.warning(
-                "指定されたカスケードファイルが見つかりません: %s. "
-                "デフォルトのカスケードを試行します.",
-                config.FACE_CASCADE_PATH,
+                "設定のカスケードファイルが見つからないため、OpenCV同梱のHaarを使用します"
             )
-            default_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
-            self.face_cascade = cv2.CascadeClassifier(default_path)
+        return path, cascade
+    return None
 
-        if self.face_cascade.empty():
-            msg = "顔検出カスケードファイルを読み込めませんでした"
-            logger.critical(msg)
-            raise RuntimeError(msg)
 
-        logger.info("顔検出器を初期化しました")
+class BaseFaceDetector(ABC):
+    """顔検出器の共通処理 (派生クラスは_detect_ndarrayを実装する)."""
 
     def detect(self, frame: NDArray[np.uint8]) -> list[FaceRect]:
         """フレームから顔を検出.
 
         Args:
-            frame: BGR画像フレーム
+            frame: BGRまたはグレースケール画像フレーム
 
         Returns:
             list: 検出された顔の矩形 [(x, y, w, h), ...]
         """
-        # グレースケールに変換
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        return [tuple(r) for r in self._detect_ndarray(frame).tolist()]  # type: ignore[misc]
 
-        # 顔検出
-        faces = self.face_cascade.detectMultiScale(
-            gray,
-            scaleFactor=config.DETECTION_SCALE_FACTOR,
-            minNeighbors=config.DETECTION_MIN_NEIGHBORS,
-            minSize=config.DETECTION_MIN_SIZE,
-        )
+    def detect_in_roi(
+        self,
+        frame: NDArray[np.uint8],
+        prev_rect: FaceRect,
+        margin: float | None = None,
+    ) -> list[FaceRect]:
+        """前回の顔の周辺領域のみから顔を検出.
 
-        return [tuple(f) for f in faces]  # type: ignore[misc]
+        Args:
+            frame: BGRまたはグレースケール画像フレーム
+            prev_rect: (x, y, w, h) 前回検出した顔の矩形
+            margin: 顔の幅・高さに対する探索領域の余白の比率 (Noneの場合はconfigの値)
+
+        Returns:
+            list: 検出された顔の矩形 (フレーム全体の座標) [(x, y, w, h), ...]
+        """
+        rects = self._detect_roi_ndarray(frame, prev_rect, margin)
+        return [tuple(r) for r in rects.tolist()]  # type: ignore[misc]
 
-    def detect_largest(self, frame: NDArray[np.uint8]) -> FaceRect | None:
+    def detect_largest(
+        self,
+        frame: NDArray[np.uint8],
+        prev_rect: FaceRect | None = None,
+    ) -> FaceRect | None:
         """最も大きい顔を検出（追尾対象）.
 
         Args:
-            frame: BGR画像フレーム
+            frame: BGRまたはグレースケール画像フレーム
+            prev_rect: 前回検出した顔の矩形 (指定時はその周辺のみ探索)
 
         Returns:
             tuple: (x, y, w, h) または None
         """
-        faces = self.detect(frame)
+        if prev_rect is not None:
+            rects = self._detect_roi_ndarray(frame, prev_rect)
+        else:
+            rects = self._detect_ndarray(frame)
 
-        if len(faces) == 0:
+        if rects.size == 0:
             return None
 
         # 面積が最大の顔を選択
-        return max(faces, key=lambda f: f[2] * f[3])
+        areas = rects[:, 2] * rects[:, 3]
+        x, y, w, h = (int(v) for v in rects[areas.argmax()])
+        return x, y, w, h
+
+    @abstractmethod
+    def _detect_ndarray(self, frame: NDArray[np.uint8]) -> NDArray[np.int32]:
+        """フレームから顔を検出し、矩形を (N, 4) の配列で返す."""
+
+    def _detect_roi_ndarray(
+        self,
+        frame: NDArray[np.uint8],
+        prev_rect: FaceRect,
+        margin: float | None = None,
+    ) -> NDArray[np.int32]:
+        """前回の顔の周辺領域から顔を検出し、フレーム全体の座標の (N, 4) 配列で返す."""
+        if margin is None:
+            margin = config.ROI_MARGIN
+
+        # 探索領域をフレーム内に収める
+        x, y, w, h = prev_rect
+        frame_h, frame_w = frame.shape[:2]
+        rx = max(0, int(x - margin * w))
+        ry = max(0, int(y - margin * h))
+        rx2 = min(frame_w, int(x + (1 + margin) * w))
+        ry2 = min(frame_h, int(y + (1 + margin) * h))
+        if rx2 <= rx or ry2 <= ry:
+            return np.empty((0, 4), dtype=np.int32)
+
+        rects = self._detect_ndarray(frame[ry:ry2, rx:rx2])
+        rects[:, :2] += (rx, ry)
+        return rects
+
+    @staticmethod
+    def _reuse_buffer(
+        buffer: NDArray[np.uint8] | None, shape: tuple[int, ...]
+    ) -> NDArray[np.uint8]:
+        """形状が同じなら既存のバッファを返し、異なれば新たに確保."""
+        if buffer is None or buffer.shape != shape:
+            return np.empty(shape, dtype=np.uint8)
+        return buffer
 
     def get_face_center(self, face_rect: FaceRect) -> tuple[int, int]:
         """顔の中心座標を計算.
@@ -115,10 +221,251 @@ class FaceDetector:
         cv2.circle(frame, (cx, cy), 5, (0, 0, 255), -1)
 
 
+class FaceDetector(BaseFaceDetector):
+    """カスケード分類器ベースの顔検出クラス."""
+
+    def __init__(self, detect_scale: float | None = None, use_cuda: bool | None = None) -> None:
+        """顔検出器を初期化.
+
+        Args:
+            detect_scale: 検出前の縮小率 (1.0以上. Noneの場合はconfigの値)
+            use_cuda: GPUが使える場合にCUDAで検出する (Noneの場合はconfigの値)
+
+        Raises:
+            ValueError: 縮小率が1.0未満の場合
+        """
+        self.detect_scale = detect_scale if detect_scale is not None else config.DETECTION_DOWNSCALE
+        if self.detect_scale < 1.0:
+            # 拡大には対応しない (最小・最大サイズと検出結果の座標は縮小率で換算するため)
+            msg = f"detect_scaleは1.0以上を指定してください: {self.detect_scale}"
+            raise ValueError(msg)
+        if use_cuda is None:
+            use_cuda = config.DETECTION_USE_CUDA
+
+        # グレースケール・縮小画像の再利用バッファ (フレームごとの確保を避ける)
+        self._gray: NDArray[np.uint8] | None = None
+        self._small: NDArray[np.uint8] | None = None
+
+        found = _find_cascade()
+        if found is None:
+            msg = "顔検出カスケードファイルを読み込めませんでした"
+            logger.critical(msg)
+            raise RuntimeError(msg)
+        cascade_path, self.face_cascade = found
+
+        # CUDA版の分類器 (使えない場合はNoneでCPUで検出)
+        self.cuda_cascade: Any = None
+        self._gpu_frame: Any = None
+        if use_cuda:
+            self._setup_cuda(cascade_path)
+
+        logger.info(
+            "顔検出器を初期化しました: %s (%s)",
+            cascade_path,
+            "CUDA" if self.cuda_cascade else "CPU",
+        )
+
+    def _detect_ndarray(self, frame: NDArray[np.uint8]) -> NDArray[np.int32]:
+        """フレームから顔を検出し、矩形を (N, 4) の配列で返す."""
+        # グレースケールに変換 (既にグレースケールなら変換不要)
+        if frame.ndim == 2:
+            gray = frame
+        else:
+            self._gray = self._reuse_buffer(self._gray, frame.shape[:2])
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+            gray = self._gray
+
+        # 縮小画像で検出してHaar特徴の評価回数を削減
+        k = self.detect_scale
+        if k > 1.0:
+            h, w = gray.shape[:2]
+            small_w, small_h = int(w / k), int(h / k)
+            self._small = self._reuse_buffer(self._small, (small_h, small_w))
+            cv2.resize(gray, (small_w, small_h), dst=self._small, interpolation=cv2.INTER_AREA)
+            small = self._small
+        else:
+            small = gray
+
+        # 顔検出
+        if self.cuda_cascade is not None:
+            self._gpu_frame.upload(small)
+            objects = self.cuda_cascade.detectMultiScale(self._gpu_frame)
+            faces = self.cuda_cascade.convert(objects)
+        else:
+            min_w, min_h = config.DETECTION_MIN_SIZE
+            max_w, max_h = config.DETECTION_MAX_SIZE
+            faces = self.face_cascade.detectMultiScale(
+                small,
+                scaleFactor=config.DETECTION_SCALE_FACTOR,
+                minNeighbors=config.DETECTION_MIN_NEIGHBORS,
+                minSize=(int(min_w / k), int(min_h / k)),
+                maxSize=(int(max_w / k), int(max_h / k)),
+            )
+
+        if len(faces) == 0:
+            return np.empty((0, 4), dtype=np.int32)
+
+        # 元の解像度の座標に戻す
+        return (np.asarray(faces).reshape(-1, 4) * k).astype(np.int32)
+
+    def _setup_cuda(self, path: str) -> None:
+        """CUDA版の分類器を準備 (GPUが使えない場合はCPUのまま)."""
+        if not _cuda_available():
+            logger.info("CUDAデバイスが見つかりません. CPUで顔検出を行います.")
+            return
+
+        try:
+            cascade = cv2.cuda.CascadeClassifier_create(path)  # type: ignore[attr-defined]
+        except (cv2.error, AttributeError) as e:
+            logger.warning("CUDA版カスケードを読み込めません: %s. CPUで顔検出を行います.", e)
+            return
+
+        # 縮小後の画像に合わせたパラメータを設定
+        k = self.detect_scale
+        min_w, min_h = config.DETECTION_MIN_SIZE
+        max_w, max_h = config.DETECTION_MAX_SIZE
+        cascade.setScaleFactor(config.DETECTION_SCALE_FACTOR)
+        cascade.setMinNeighbors(config.DETECTION_MIN_NEIGHBORS)
+        cascade.setMinObjectSize((int(min_w / k), int(min_h / k)))
+        cascade.setMaxObjectSize((int(max_w / k), int(max_h / k)))
+
+        self.cuda_cascade = cascade
+        self._gpu_frame = cv2.cuda.GpuMat()
+
+
+class FaceDetectorYuNet(BaseFaceDetector):
+    """OpenCV DNN (YuNet) ベースの顔検出クラス."""
+
+    def __init__(self, model_path: str | None = None) -> None:
+        """顔検出器を初期化.
+
+        Args:
+            model_path: YuNetのONNXモデルのパス (Noneの場合はconfigの値)
+        """
+        path = model_path or config.YUNET_MODEL_PATH
+
+        # CUDAが使える場合はFP16で推論
+        if config.DETECTION_USE_CUDA and _cuda_available():
+            backend, target = cv2.dnn.DNN_BACKEND_CUDA, cv2.dnn.DNN_TARGET_CUDA_FP16
+        else:
+            backend, target = cv2.dnn.DNN_BACKEND_OPENCV, cv2.dnn.DNN_TARGET_CPU
+
+        self._input_size = (config.CAMERA_WIDTH, config.CAMERA_HEIGHT)
+        try:
+            self.model = cv2.FaceDetectorYN.create(
+                path,
+                "",
+                self._input_size,
+                config.YUNET_SCORE_THRESHOLD,
+                config.YUNET_NMS_THRESHOLD,
+                config.YUNET_TOP_K,
+                backend,
+                target,
+            )
+        except cv2.error as e:
+            msg = f"YuNetモデルを読み込めませんでした: {path}"
+            logger.critical(msg)
+            raise RuntimeError(msg) from e
+
+        # グレースケール入力をBGRに戻すための再利用バッファ
+        self._bgr: NDArray[np.uint8] | None = None
+
+        logger.info(
+            "顔検出器を初期化しました: %s (%s)",
+            path,
+            "CUDA" if target == cv2.dnn.DNN_TARGET_CUDA_FP16 else "CPU",
+        )
+
+    def _detect_ndarray(self, frame: NDArray[np.uint8]) -> NDArray[np.int32]:
+        """フレームから顔を検出し、矩形を (N, 4) の配列で返す."""
+        # YuNetは3チャンネル入力のみ対応
+        if frame.ndim == 2:
+            self._bgr = self._reuse_buffer(self._bgr, (*frame.shape, 3))
+            cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR, dst=self._bgr)
+            frame = self._bgr
+
+        h, w = frame.shape[:2]
+        if (w, h) != self._input_size:
+            self._input_size = (w, h)
+            self.model.setInputSize(self._input_size)
+
+        _, faces = self.model.detect(frame)
+        if faces is None:
+            return np.empty((0, 4), dtype=np.int32)
+
+        # 各行は (x, y, w, h, 目・鼻・口の座標..., スコア)
+        return faces[:, :4].astype(np.int32)
+
+    def _detect_roi_ndarray(
+        self,
+        frame: NDArray[np.uint8],
+        prev_rect: FaceRect,  # noqa: ARG002
+        margin: float | None = None,  # noqa: ARG002
+    ) -> NDArray[np.int32]:
+        """フレーム全体から顔を検出 (YuNetは入力サイズが変わるとネットワークを作り直すため切り出さない)."""
+        return self._detect_ndarray(frame)
+
+
+class FaceDetectorDlib(BaseFaceDetector):
+    """dlibのHOG顔検出器ベースの顔検出クラス (SIMD最適化されたC++実装)."""
+
+    def __init__(self, upsample: int | None = None) -> None:
+        """顔検出器を初期化.
+
+        Args:
+            upsample: 検出前の画像の拡大回数 (Noneの場合はconfigの値)
+        """
+        if not DLIB_AVAILABLE:
+            msg = "dlibがインストールされていません"
+            logger.critical(msg)
+            raise RuntimeError(msg)
+
+        self.upsample = upsample if upsample is not None else config.DLIB_UPSAMPLE
+        self.hog_detector = dlib.get_frontal_face_detector()
+
+        # グレースケールの再利用バッファ
+        self._gray: NDArray[np.uint8] | None = None
+
+        logger.info("顔検出器を初期化しました: dlib HOG")
+
+    def _detect_ndarray(self, frame: NDArray[np.uint8]) -> NDArray[np.int32]:
+        """フレームから顔を検出し、矩形を (N, 4) の配列で返す."""
+        if frame.ndim == 2:
+            # dlibは連続したメモリのみ受け付ける (ROIの切り出しはビューのため)
+            gray = np.ascontiguousarray(frame)
+        else:
+            self._gray = self._reuse_buffer(self._gray, frame.shape[:2])
+            cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+            gray = self._gray
+
+        rects = self.hog_detector(gray, self.upsample)
+        if len(rects) == 0:
+            return np.empty((0, 4), dtype=np.int32)
+
+        # dlib.rectangle (left, top, right, bottom) -> (x, y, w, h)
+        return np.array([(r.left(), r.top(), r.width(), r.height()) for r in rects], dtype=np.int32)
+
+
+def create_face_detector() -> BaseFaceDetector:
+    """configのDETECTORに応じた顔検出器を作成.
+
+    Returns:
+        BaseFaceDetector: 顔検出器
+    """
+    if config.DETECTOR == "cascade":
+        return FaceDetector()
+    if config.DETECTOR == "yunet":
+        return FaceDetectorYuNet()
+    if config.DETECTOR == "dlib":
+        return FaceDetectorDlib()
+    msg = f"未対応の顔検出器です: {config.DETECTOR}"
+    raise ValueError(msg)
+
+
 if __name__ == "__main__":
     from src.camera import Camera
 
-    detector = FaceDetector()
+    detector = create_face_detector()
 
     with Camera(use_csi=False) as cam:
         logger.info("顔検出テスト - 'q'で終了")
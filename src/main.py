@@ -4,17 +4,20 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 import config
 import cv2
 import numpy as np
 
 from src.camera import Camera
-from src.face_detector import FaceDetector, FaceRect
+from src.face_detector import BaseFaceDetector, FaceRect, create_face_detector
 from src.logger import setup_logger
 from src.servo_controller import ServoController
+from src.threaded_detector import ThreadedDetector
 from src.tracker import FaceTracker
 
 if TYPE_CHECKING:
@@ -22,6 +25,9 @@ if TYPE_CHECKING:
 
 logger = setup_logger()
 
+# 中心線の色 (BGR)
+_CROSS_COLOR = (100, 100, 100)
+
 
 def parse_args() -> argparse.Namespace:
     """コマンドライン引数をパース."""
@@ -35,19 +41,39 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+@functools.cache
+def _center_cross_pixels(height: int, width: int) -> tuple[NDArray[np.intp], NDArray[np.intp]]:
+    """中心線の画素位置を一度だけ描画して求める.
+
+    Returns:
+        tuple: (行インデックス, 列インデックス)
+    """
+    mask = np.zeros((height, width), dtype=np.uint8)
+    cx, cy = width // 2, height // 2
+    cv2.line(mask, (cx - 20, cy), (cx + 20, cy), 255, 1)
+    cv2.line(mask, (cx, cy - 20), (cx, cy + 20), 255, 1)
+    ys, xs = np.nonzero(mask)
+    return ys, xs
+
+
 def draw_overlay(
     frame: NDArray[np.uint8],
     tracker: FaceTracker,
-    face: FaceRect | None,  # noqa: ARG001
+    detector: BaseFaceDetector,
+    face: FaceRect | None,
 ) -> NDArray[np.uint8]:
-    """画面にオーバーレイを描画."""
+    """画面にオーバーレイ (顔の矩形・中心線・ステータス) を描画.
+
+    描画はすべてここにまとめ、表示なしの場合は呼び出さない.
+    """
     status = tracker.get_status()
 
-    # 中心線
-    h, w = frame.shape[:2]
-    cx, cy = w // 2, h // 2
-    cv2.line(frame, (cx - 20, cy), (cx + 20, cy), (100, 100, 100), 1)
-    cv2.line(frame, (cx, cy - 20), (cx, cy + 20), (100, 100, 100), 1)
+    # 顔の矩形
+    if face is not None:
+        detector.draw_face(frame, face)
+
+    # 中心線 (事前に計算した画素位置へ色を書き込むだけ)
+    frame[_center_cross_pixels(*frame.shape[:2])] = _CROSS_COLOR
 
     # ステータス表示
     if status.tracking:
@@ -70,16 +96,24 @@ def main() -> None:
     logger.info("  Jetson Nano 顔追尾カメラシステム")
     logger.info("=" * 50)
 
+    # OpenCVのスレッド数を固定 (CPUコアの固定は検出スレッドだけが自身に対して行う.
+    # メインスレッドを固定するとGStreamerやOpenCVのスレッドまで同じコアを継承するため)
+    cv2.setNumThreads(config.OPENCV_NUM_THREADS)
+
     use_csi = not args.usb
     logger.info(f"カメラモード: {'CSI' if use_csi else 'USB'}")
     logger.info("終了: 'q'キーまたはCtrl+C")
 
+    # YuNetはカラー画像を入力とするため、CSIカメラからもBGRで取得する
+    output_gray = config.CAMERA_OUTPUT_GRAY and config.DETECTOR != "yunet"
+
     try:
         with (
-            Camera(use_csi=use_csi) as camera,
+            Camera(use_csi=use_csi, output_gray=output_gray) as camera,
             ServoController() as servo,
+            ThreadedDetector(create_face_detector()) as threaded,
         ):
-            detector = FaceDetector()
+            detector = threaded.detector
             tracker = FaceTracker(
                 servo,
                 config.CAMERA_WIDTH,
@@ -93,6 +127,7 @@ def main() -> None:
             logger.info("追尾開始...")
             frame_count = 0
             start_time = time.time()
+            last_result_id = 0
 
             while True:
                 ret, frame = camera.read()
@@ -100,27 +135,35 @@ def main() -> None:
                     logger.error("フレーム取得失敗")
                     break
 
-                # 顔検出
-                face = detector.detect_largest(frame)
-
-                # 追尾更新
-                if face is not None:
-                    face_center = detector.get_face_center(face)
-                    tracker.update(face_center)
-                    detector.draw_face(frame, face)
-                else:
-                    tracker.update(None)
-
-                # FPS計算
+                # 顔検出 (DETECTION_STRIDEフレームごとに検出スレッドへ渡し、直近の結果を受け取る)
+                if frame_count % config.DETECTION_STRIDE == 0:
+                    threaded.submit(frame)
+                result_id, face = threaded.get_latest_result()
+
+                # 追尾更新 (新しい検出結果が出たときのみ)
+                if result_id != last_result_id:
+                    last_result_id = result_id
+                    if face is not None:
+                        face_center = detector.get_face_center(face)
+                        tracker.update(face_center)
+                    else:
+                        tracker.update(None)
+
+                # FPS計算 (INFOログが無効なら計算しない)
                 frame_count += 1
-                if frame_count % 30 == 0:
+                if frame_count % 30 == 0 and logger.isEnabledFor(logging.INFO):
                     elapsed = time.time() - start_time
                     fps = frame_count / elapsed
-                    logger.info(f"FPS: {fps:.1f}")
+                    logger.info("FPS: %.1f", fps)
 
-                # 映像表示
+                # 映像表示 (表示なしの場合は描画処理を一切行わない)
                 if not args.no_display:
-                    frame = draw_overlay(frame, tracker, face)
+                    # 表示用のBGR画像を用意 (検出スレッドが参照中のフレームには描画しない)
+                    if frame.ndim == 2:
+                        frame = cast("NDArray[np.uint8]", cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR))
+                    else:
+                        frame = frame.copy()
+                    frame = draw_overlay(frame, tracker, detector, face)
                     cv2.imshow("Face Tracking", frame)
 
                     key = cv2.waitKey(1) & 0xFF
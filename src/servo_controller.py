@@ -5,11 +5,16 @@ from __future__ import annotations
 from typing import Any
 
 import config
+import numpy as np
 
 from src.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 0.5°刻みのデューティ比テーブル (インデックス = 角度 * 2, 0°〜180°).
+# 刻みをSERVO_MIN_STEPに揃え、最小ステップ以上の変化では必ず異なる値を引くようにする
+_DUTY_LUT = np.linspace(2.5, 12.5, 361, dtype=np.float32)
+
 # Jetson.GPIOはJetson上でのみ利用可能
 try:
     import Jetson.GPIO as GPIO
@@ -24,6 +29,15 @@ except ImportError:
 class ServoController:
     """サーボモーター制御クラス."""
 
+    # 可動範囲・中央位置・最小ステップ (毎回のconfig参照を避けるためクラス属性として保持)
+    _PAN_MIN = config.SERVO_PAN_MIN
+    _PAN_MAX = config.SERVO_PAN_MAX
+    _PAN_CENTER = config.SERVO_PAN_CENTER
+    _TILT_MIN = config.SERVO_TILT_MIN
+    _TILT_MAX = config.SERVO_TILT_MAX
+    _TILT_CENTER = config.SERVO_TILT_CENTER
+    _MIN_STEP = config.SERVO_MIN_STEP
+
     def __init__(self, pan_pin: int | None = None, tilt_pin: int | None = None) -> None:
         """サーボコントローラーを初期化.
 
@@ -35,8 +49,8 @@ class ServoController:
         self.tilt_pin = tilt_pin or config.SERVO_TILT_PIN
 
         # 現在の角度
-        self.pan_angle: float = config.SERVO_PAN_CENTER
-        self.tilt_angle: float = config.SERVO_TILT_CENTER
+        self.pan_angle: float = self._PAN_CENTER
+        self.tilt_angle: float = self._TILT_CENTER
 
         self.pwm_pan: Any = None
         self.pwm_tilt: Any = None
@@ -61,9 +75,9 @@ class ServoController:
         self.pwm_tilt.start(self._angle_to_duty(self.tilt_angle))
 
         self.initialized = True
-        logger.info(f"サーボ初期化完了: Pan={self.pan_angle}°, Tilt={self.tilt_angle}°")
+        logger.info("サーボ初期化完了: Pan=%s°, Tilt=%s°", self.pan_angle, self.tilt_angle)
         return self
-    
+
     def warn_if_simulated(self) -> None:
         """シミュレーションモードの場合に警告を表示."""
         if not JETSON_AVAILABLE:
@@ -77,16 +91,12 @@ class ServoController:
         """角度をデューティ比に変換.
 
         SG90サーボ: 0° = 2.5%, 180° = 12.5%
+        0°〜180°は最も近い0.5°刻みの角度でテーブルを引き (誤差0.25°以内)、範囲外は計算する.
         """
-        return 2.5 + (angle / 180.0) * 10.0
-
-    def _clamp_pan(self, angle: float) -> float:
-        """パン角度を制限範囲内に収める."""
-        return max(config.SERVO_PAN_MIN, min(config.SERVO_PAN_MAX, angle))
-
-    def _clamp_tilt(self, angle: float) -> float:
-        """チルト角度を制限範囲内に収める."""
-        return max(config.SERVO_TILT_MIN, min(config.SERVO_TILT_MAX, angle))
+        if 0 <= angle <= 180:
+            # 四捨五入 (偶数丸めだと最小ステップ分の変化が同じインデックスになりうる)
+            return float(_DUTY_LUT[int(angle * 2.0 + 0.5)])
+        return 2.5 + angle * (1.0 / 18.0)
 
     def set_pan(self, angle: float) -> None:
         """パン角度を設定.
@@ -94,12 +104,16 @@ class ServoController:
         Args:
             angle: 目標角度 (0-180)
         """
-        self.pan_angle = self._clamp_pan(angle)
+        angle = min(max(angle, self._PAN_MIN), self._PAN_MAX)
+        # 分解能以下の変化ではPWMを書き換えない
+        if abs(angle - self.pan_angle) < self._MIN_STEP:
+            return
+        self.pan_angle = angle
 
         if JETSON_AVAILABLE and self.pwm_pan:
             self.pwm_pan.ChangeDutyCycle(self._angle_to_duty(self.pan_angle))
         else:
-            logger.debug(f"[SIM] Pan: {self.pan_angle}°")
+            logger.debug("[SIM] Pan: %s°", self.pan_angle)
             # 最初の1回だけ警告を出すなどの処理を入れても良いが、
             # 現状はログ出力のみとする
 
@@ -109,21 +123,52 @@ class ServoController:
         Args:
             angle: 目標角度 (30-150)
         """
-        self.tilt_angle = self._clamp_tilt(angle)
+        angle = min(max(angle, self._TILT_MIN), self._TILT_MAX)
+        # 分解能以下の変化ではPWMを書き換えない
+        if abs(angle - self.tilt_angle) < self._MIN_STEP:
+            return
+        self.tilt_angle = angle
 
         if JETSON_AVAILABLE and self.pwm_tilt:
             self.pwm_tilt.ChangeDutyCycle(self._angle_to_duty(self.tilt_angle))
         else:
-            logger.debug(f"[SIM] Tilt: {self.tilt_angle}°")
+            logger.debug("[SIM] Tilt: %s°", self.tilt_angle)
 
     def set_position(self, pan: float, tilt: float) -> None:
         """パンとチルトを同時に設定."""
-        self.set_pan(pan)
-        self.set_tilt(tilt)
+        self._set_both(pan, tilt)
+
+    def _set_both(self, pan: float, tilt: float) -> None:
+        """パンとチルトをまとめて設定 (分岐とログ出力を1回で済ませる).
+
+        Args:
+            pan: 目標パン角度
+            tilt: 目標チルト角度
+        """
+        pan = min(max(pan, self._PAN_MIN), self._PAN_MAX)
+        tilt = min(max(tilt, self._TILT_MIN), self._TILT_MAX)
+
+        # 分解能以下の変化ではPWMを書き換えない
+        pan_changed = abs(pan - self.pan_angle) >= self._MIN_STEP
+        tilt_changed = abs(tilt - self.tilt_angle) >= self._MIN_STEP
+        if not (pan_changed or tilt_changed):
+            return
+        if pan_changed:
+            self.pan_angle = pan
+        if tilt_changed:
+            self.tilt_angle = tilt
+
+        if JETSON_AVAILABLE and self.pwm_pan and self.pwm_tilt:
+            if pan_changed:
+                self.pwm_pan.ChangeDutyCycle(self._angle_to_duty(pan))
+            if tilt_changed:
+                self.pwm_tilt.ChangeDutyCycle(self._angle_to_duty(tilt))
+        else:
+            logger.debug("[SIM] Pan: %s°, Tilt: %s°", self.pan_angle, self.tilt_angle)
 
     def center(self) -> None:
         """サーボを中央位置に戻す."""
-        self.set_position(config.SERVO_PAN_CENTER, config.SERVO_TILT_CENTER)
+        self.set_position(self._PAN_CENTER, self._TILT_CENTER)
 
     def get_position(self) -> tuple[float, float]:
         """現在の位置を取得."""
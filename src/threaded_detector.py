@@ -0,0 +1,189 @@
+"""非同期顔検出モジュール - 顔検出をバックグラウンドスレッドで実行しキャプチャと分離."""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+
+import config
+import numpy as np
+
+from src.face_detector import BaseFaceDetector, FaceRect, create_face_detector
+from src.logger import get_logger
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger = get_logger(__name__)
+
+
+def set_thread_affinity(cpus: tuple[int, ...] | None) -> None:
+    """呼び出し元のスレッドを指定のCPUコアに固定 (Linux以外やNoneの場合は何もしない).
+
+    Args:
+        cpus: 使用するCPUコア番号
+    """
+    if cpus is None or not hasattr(os, "sched_setaffinity"):
+        return
+    try:
+        # Linuxではpid=0で呼び出し元のスレッドのみが対象になる
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logger.warning("CPUアフィニティを設定できません: %s", e)
+
+
+class ThreadedDetector:
+    """顔検出器をワーカースレッドで実行するクラス.
+
+    キャプチャ側は1枠のスロットにフレームを置くだけで待たされない.
+    未処理のフレームは新しいフレームで上書きされ、ワーカーは常に最新のフレームを処理する.
+    """
+
+    def __init__(self, detector: BaseFaceDetector | None = None) -> None:
+        """検出スレッドを初期化.
+
+        Args:
+            detector: 使用する顔検出器 (Noneの場合はconfigに応じて新規作成)
+        """
+        self.detector = detector if detector is not None else create_face_detector()
+
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Condition(self._lock)
+
+        # 1枠のスロット (最新のフレームと検出結果)
+        self._latest_frame: NDArray[np.uint8] | None = None
+        self._latest_face: FaceRect | None = None
+        self._result_id = 0
+
+        # ワーカースレッドで発生した例外 (取得時に呼び出し元へ送出する)
+        self._error: Exception | None = None
+
+        # 周辺探索 (ROI) の状態 (ワーカースレッドのみが参照)
+        self._roi_face: FaceRect | None = None
+        self._roi_misses = 0
+
+        self._running = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> ThreadedDetector:
+        """検出スレッドを起動."""
+        if self._thread is not None:
+            return self
+
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="face-detector", daemon=True)
+        self._thread.start()
+        logger.info("検出スレッド起動")
+        return self
+
+    def submit(self, frame: NDArray[np.uint8]) -> None:
+        """検出対象のフレームを渡す (ブロックしない).
+
+        Args:
+            frame: BGRまたはグレースケール画像フレーム
+        """
+        with self._frame_ready:
+            self._latest_frame = frame
+            self._frame_ready.notify()
+
+    def get_latest_face(self) -> FaceRect | None:
+        """最新の検出結果を取得.
+
+        Returns:
+            tuple: (x, y, w, h) または None
+
+        Raises:
+            Exception: 検出スレッドが例外で停止した場合、その例外
+        """
+        with self._lock:
+            self._raise_error()
+            return self._latest_face
+
+    def get_latest_result(self) -> tuple[int, FaceRect | None]:
+        """最新の検出結果を通し番号付きで取得.
+
+        通し番号は結果が更新されるたびに増えるため、新しい結果かどうかの判定に使える.
+
+        Returns:
+            tuple: (結果の通し番号, (x, y, w, h) または None)
+
+        Raises:
+            Exception: 検出スレッドが例外で停止した場合、その例外
+        """
+        with self._lock:
+            self._raise_error()
+            return self._result_id, self._latest_face
+
+    def stop(self) -> None:
+        """検出スレッドを停止."""
+        if self._thread is None:
+            return
+
+        with self._frame_ready:
+            self._running = False
+            self._frame_ready.notify()
+        self._thread.join()
+        self._thread = None
+        logger.info("検出スレッド停止")
+
+    def _run(self) -> None:
+        """ワーカースレッドの処理."""
+        # キャプチャ側とは別のコアで検出する
+        set_thread_affinity(config.DETECTOR_CPU_AFFINITY)
+
+        while True:
+            with self._frame_ready:
+                while self._running and self._latest_frame is None:
+                    self._frame_ready.wait()
+                if not self._running:
+                    return
+                frame = self._latest_frame
+                self._latest_frame = None
+            if frame is None:
+                continue
+
+            try:
+                face = self._detect(frame)
+            except Exception as e:
+                # 例外を保存してワーカーを止め、結果の取得時にメインループへ伝える
+                logger.exception("顔検出中にエラーが発生しました")
+                with self._lock:
+                    self._error = e
+                    self._running = False
+                return
+
+            with self._lock:
+                self._latest_face = face
+                self._result_id += 1
+
+    def _raise_error(self) -> None:
+        """ワーカースレッドで発生した例外を送出 (ロックを保持した状態で呼ぶ)."""
+        if self._error is not None:
+            raise self._error
+
+    def _detect(self, frame: NDArray[np.uint8]) -> FaceRect | None:
+        """前回の顔の周辺を優先して検出し、見失い続けたら全画面探索に戻る."""
+        face = self.detector.detect_largest(frame, self._roi_face)
+
+        if face is not None:
+            self._roi_face = face
+            self._roi_misses = 0
+        elif self._roi_face is not None:
+            self._roi_misses += 1
+            if self._roi_misses >= config.ROI_MAX_MISSES:
+                self._roi_face = None
+                self._roi_misses = 0
+
+        return face
+
+    def __enter__(self) -> ThreadedDetector:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: object,
+    ) -> None:
+        self.stop()
@@ -6,8 +6,10 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import config
+import numpy as np
 
 from src.logger import get_logger
+from src.tracker_kernels import idle_step, pid_step, track_step
 
 if TYPE_CHECKING:
     from src.servo_controller import ServoController
@@ -15,7 +17,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackerStatus:
     """トラッカーの現在状態."""
 
@@ -26,20 +28,32 @@ class TrackerStatus:
 
 
 class PIDController:
-    """PID制御器."""
+    """1軸分のPID制御器 (速度形).
+
+    計算はFaceTrackerの追尾計算と同じpid_stepカーネルで行う.
+    """
+
+    # デフォルトのゲインと出力上限 (毎回のconfig参照を避けるためクラス属性として保持)
+    _KP = config.PID_KP
+    _KI = config.PID_KI
+    _KD = config.PID_KD
+    _OUTPUT_LIMIT = config.PID_OUTPUT_LIMIT
 
     def __init__(
         self,
         kp: float | None = None,
         ki: float | None = None,
         kd: float | None = None,
+        output_limit: float | None = None,
     ) -> None:
-        self.kp = kp if kp is not None else config.PID_KP
-        self.ki = ki if ki is not None else config.PID_KI
-        self.kd = kd if kd is not None else config.PID_KD
+        self.kp = kp if kp is not None else self._KP
+        self.ki = ki if ki is not None else self._KI
+        self.kd = kd if kd is not None else self._KD
+        self.output_limit = output_limit if output_limit is not None else self._OUTPUT_LIMIT
 
-        self.prev_error: float = 0
-        self.integral: float = 0
+        self.prev_error: float = 0.0
+        self.prev_error2: float = 0.0
+        self.raw_output: float = 0.0  # 上限で制限する前の出力
 
     def compute(self, error: float) -> float:
         """PID出力を計算.
@@ -50,23 +64,33 @@ class PIDController:
         Returns:
             float: 制御出力
         """
-        self.integral += error
-        derivative = error - self.prev_error
-
-        output = self.kp * error + self.ki * self.integral + self.kd * derivative
-
-        self.prev_error = error
+        output, self.raw_output, self.prev_error, self.prev_error2 = pid_step(
+            float(error),
+            self.prev_error,
+            self.prev_error2,
+            self.raw_output,
+            self.kp,
+            self.ki,
+            self.kd,
+            self.output_limit,
+        )
         return output
 
     def reset(self) -> None:
         """状態をリセット."""
-        self.prev_error = 0
-        self.integral = 0
+        self.prev_error = 0.0
+        self.prev_error2 = 0.0
+        self.raw_output = 0.0
 
 
 class FaceTracker:
     """顔追尾コントローラー."""
 
+    # スムージング係数とデッドゾーン (毎フレームのconfig参照を避けるためクラス属性として保持)
+    _SMOOTHING_FACTOR = config.SMOOTHING_FACTOR
+    _DEADZONE_X = config.DEADZONE_X
+    _DEADZONE_Y = config.DEADZONE_Y
+
     def __init__(
         self,
         servo_controller: ServoController,
@@ -88,28 +112,63 @@ class FaceTracker:
         self.center_x = frame_width // 2
         self.center_y = frame_height // 2
 
-        # PID制御器
-        self.pid_pan = PIDController()
-        self.pid_tilt = PIDController()
-
-        # スムージング用
-        self.smooth_pan: float = config.SERVO_PAN_CENTER
-        self.smooth_tilt: float = config.SERVO_TILT_CENTER
+        # 追尾計算の状態 ([パン, チルト] の2要素ずつ)
+        # [前回の誤差, 前々回の誤差, PID出力 (制限前), スムージング済み角度]
+        self._state = np.zeros(8)
+
+        # スムージング用 ([パン, チルト])
+        self.smooth = self._state[6:8]
+
+        # 追尾計算のパラメータ (カーネルがグローバル変数を参照しないよう配列で渡す)
+        self._params = np.array(
+            [
+                config.PID_KP,
+                config.PID_KI,
+                config.PID_KD,
+                config.PID_OUTPUT_LIMIT,
+                self._SMOOTHING_FACTOR,
+                self._DEADZONE_X,
+                self._DEADZONE_Y,
+            ],
+            dtype=np.float64,
+        )
 
         # 追跡状態
         self.tracking = False
         self.lost_count = 0
         self.lost_threshold = 30  # これ以上見失ったら中央に戻る
 
+        # get_statusで使い回すステータス
+        self._status = TrackerStatus(tracking=False, pan=0.0, tilt=0.0, lost_count=0)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """追跡状態・PID・スムージングを初期状態に戻す (サーボは動かさない)."""
+        self.tracking = False
+        self.lost_count = 0
+        self._reset_control()
+
+        status = self._status
+        status.tracking = False
+        status.pan = float(config.SERVO_PAN_CENTER)
+        status.tilt = float(config.SERVO_TILT_CENTER)
+        status.lost_count = 0
+
+    def _reset_control(self) -> None:
+        """PIDとスムージングの状態を初期値に戻す."""
+        self._state.fill(0.0)
+        self.smooth[:] = (config.SERVO_PAN_CENTER, config.SERVO_TILT_CENTER)
+
     def update(self, face_center: tuple[int, int] | None) -> None:
         """顔位置に基づいてサーボを更新.
 
         Args:
             face_center: (x, y) 顔の中心座標、またはNone
         """
+        # 見失ったときの処理は別メソッドに追い出し、追尾中の処理を分岐なしで続ける
         if face_center is None:
-            self._handle_face_lost()
-            return
+            return self._on_lost()
 
         self.tracking = True
         self.lost_count = 0
@@ -120,45 +179,37 @@ class FaceTracker:
         error_x = self.center_x - face_x  # 顔が左にあれば正
         error_y = face_y - self.center_y  # 顔が上にあれば正
 
-        # デッドゾーン内なら動かさない
-        if abs(error_x) < config.DEADZONE_X:
-            error_x = 0
-        if abs(error_y) < config.DEADZONE_Y:
-            error_y = 0
-
-        # PID制御で調整量を計算
-        delta_pan = self.pid_pan.compute(error_x)
-        delta_tilt = self.pid_tilt.compute(error_y)
+        # 両軸ともデッドゾーン内ならサーボへの書き込みを行わない
+        # (PIDの履歴は誤差0として進め、デッドゾーンを出たときに古い誤差で微分しない)
+        if abs(error_x) < self._DEADZONE_X and abs(error_y) < self._DEADZONE_Y:
+            idle_step(self._state, self._params)
+            return
 
-        # 現在位置からの相対移動
+        # 誤差計算・デッドゾーン・PID・スムージングを2軸まとめて1回で計算
         pan, tilt = self.servo.get_position()
-        target_pan = pan + delta_pan
-        target_tilt = tilt + delta_tilt
-
-        # スムージング適用
-        self.smooth_pan = self._smooth(self.smooth_pan, target_pan)
-        self.smooth_tilt = self._smooth(self.smooth_tilt, target_tilt)
+        target_pan, target_tilt = track_step(
+            float(face_x),
+            float(face_y),
+            float(self.center_x),
+            float(self.center_y),
+            float(pan),
+            float(tilt),
+            self._state,
+            self._params,
+        )
 
         # サーボ更新
-        self.servo.set_position(self.smooth_pan, self.smooth_tilt)
-
-    def _smooth(self, current: float, target: float) -> float:
-        """指数移動平均によるスムージング."""
-        alpha = config.SMOOTHING_FACTOR
-        return current + alpha * (target - current)
+        self.servo.set_position(target_pan, target_tilt)
 
-    def _handle_face_lost(self) -> None:
-        """顔を見失ったときの処理."""
+    def _on_lost(self) -> None:
+        """顔を見失ったときの処理 (追尾中はほぼ通らないコールドパス)."""
         self.lost_count += 1
 
         if self.lost_count > self.lost_threshold and self.tracking:
             # 一定時間見失ったら中央に戻る
             self.tracking = False
-            self.pid_pan.reset()
-            self.pid_tilt.reset()
+            self._reset_control()
             self.servo.center()
-            self.smooth_pan = config.SERVO_PAN_CENTER
-            self.smooth_tilt = config.SERVO_TILT_CENTER
             logger.info("顔をロスト - 中央に復帰")
 
     def is_tracking(self) -> bool:
@@ -166,11 +217,12 @@ class FaceTracker:
         return self.tracking
 
     def get_status(self) -> TrackerStatus:
-        """現在のステータスを取得."""
-        pan, tilt = self.servo.get_position()
-        return TrackerStatus(
-            tracking=self.tracking,
-            pan=pan,
-            tilt=tilt,
-            lost_count=self.lost_count,
-        )
+        """現在のステータスを取得.
+
+        毎回同じオブジェクトを更新して返すため、値を保持したい場合はコピーすること.
+        """
+        status = self._status
+        status.tracking = self.tracking
+        status.pan, status.tilt = self.servo.get_position()
+        status.lost_count = self.lost_count
+        return status
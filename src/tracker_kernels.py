@@ -0,0 +1,151 @@
+"""追尾計算カーネルモジュール - デッドゾーン・PID・スムージングを1回の呼び出しで計算."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from src.logger import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+
+logger = get_logger(__name__)
+
+# NumbaがあればJITコンパイルする (なければ通常のPython関数として実行)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    logger.info("Numbaが利用できません（Pythonで追尾計算を行います）")
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]  # noqa: ARG001
+        """numba.njitの代替 (関数をそのまま返す)."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(
+    "UniTuple(float64, 4)(float64, float64, float64, float64, float64, float64, float64, float64)",
+    cache=True,
+    fastmath=True,
+)
+def pid_step(
+    error: float,
+    prev_error: float,
+    prev_error2: float,
+    raw_output: float,
+    kp: float,
+    ki: float,
+    kd: float,
+    limit: float,
+) -> tuple[float, float, float, float]:
+    """1軸分の速度形 (増分形) PID計算 (型を固定しているためインポート時にコンパイルされる).
+
+    前回の出力 (制限前) に今回の増分を加える. 制限前の出力を保持するため飽和中も
+    比例・微分の履歴は失われず、積分の増分だけを制限内に収めて積分の飽和を防ぐ.
+
+    Args:
+        error: 目標との誤差
+        prev_error: 前回の誤差
+        prev_error2: 前々回の誤差
+        raw_output: 前回の制御出力 (制限前)
+        kp: 比例ゲイン
+        ki: 積分ゲイン
+        kd: 微分ゲイン
+        limit: 制御出力の上限 (絶対値)
+
+    Returns:
+        tuple: (制御出力, 制限前の制御出力, 今回の誤差, 前回の誤差)
+    """
+    raw_output += kp * (error - prev_error) + kd * (error - 2.0 * prev_error + prev_error2)
+
+    # 積分の増分は出力を上限の外へ押し出さない分だけ加える
+    integral = ki * error
+    if integral > 0.0:
+        integral = min(integral, max(limit - raw_output, 0.0))
+    elif integral < 0.0:
+        integral = max(integral, min(-limit - raw_output, 0.0))
+    raw_output += integral
+
+    output = min(max(raw_output, -limit), limit)
+    return output, raw_output, error, prev_error
+
+
+@njit(
+    "UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64, "
+    "float64[::1], float64[::1])",
+    cache=True,
+    fastmath=True,
+)
+def track_step(
+    face_x: float,
+    face_y: float,
+    center_x: float,
+    center_y: float,
+    pan: float,
+    tilt: float,
+    state: NDArray[np.float64],
+    params: NDArray[np.float64],
+) -> tuple[float, float]:
+    """1フレーム分の追尾計算 (誤差計算 -> デッドゾーン -> PID -> 指数移動平均).
+
+    状態はその場で更新する. 各項目は [パン, チルト] の2要素ずつ並ぶ.
+
+    Args:
+        face_x: 顔の中心のX座標
+        face_y: 顔の中心のY座標
+        center_x: 画面中心のX座標
+        center_y: 画面中心のY座標
+        pan: 現在のパン角度
+        tilt: 現在のチルト角度
+        state: 状態 [前回の誤差, 前々回の誤差, PID出力 (制限前), スムージング済み角度]
+        params: パラメータ [kp, ki, kd, PID出力の上限, スムージング係数,
+            水平方向のデッドゾーン, 垂直方向のデッドゾーン]
+
+    Returns:
+        tuple: (目標パン角度, 目標チルト角度)
+    """
+    kp, ki, kd, limit, alpha = params[0], params[1], params[2], params[3], params[4]
+
+    error_x = center_x - face_x  # 顔が左にあれば正
+    error_y = face_y - center_y  # 顔が上にあれば正
+
+    # デッドゾーン内の軸は動かさない
+    if abs(error_x) < params[5]:
+        error_x = 0.0
+    if abs(error_y) < params[6]:
+        error_y = 0.0
+
+    # PID制御で調整量を計算
+    delta_pan, state[4], state[0], state[2] = pid_step(
+        error_x, state[0], state[2], state[4], kp, ki, kd, limit
+    )
+    delta_tilt, state[5], state[1], state[3] = pid_step(
+        error_y, state[1], state[3], state[5], kp, ki, kd, limit
+    )
+
+    # 現在位置からの相対移動にスムージングを適用
+    state[6] += alpha * (pan + delta_pan - state[6])
+    state[7] += alpha * (tilt + delta_tilt - state[7])
+
+    return state[6], state[7]
+
+
+@njit("void(float64[::1], float64[::1])", cache=True, fastmath=True)
+def idle_step(state: NDArray[np.float64], params: NDArray[np.float64]) -> None:
+    """両軸ともデッドゾーン内のフレームで、誤差0としてPIDの履歴だけを進める.
+
+    サーボは動かさないためスムージング済み角度は更新しない.
+    デッドゾーンを出たときの微分項が古い誤差を参照しないようにする.
+
+    Args:
+        state: track_stepと同じ状態配列 (その場で更新する)
+        params: track_stepと同じパラメータ配列
+    """
+    kp, ki, kd, limit = params[0], params[1], params[2], params[3]
+    _, state[4], state[0], state[2] = pid_step(0.0, state[0], state[2], state[4], kp, ki, kd, limit)
+    _, state[5], state[1], state[3] = pid_step(0.0, state[1], state[3], state[5], kp, ki, kd, limit)
@@ -14,6 +14,11 @@ class TestConfig:
         assert config.CAMERA_HEIGHT > 0
         assert config.CAMERA_FPS > 0
 
+    def test_pipeline_latest_frame_only(self) -> None:
+        """GStreamerパイプラインが最新フレームのみを渡すこと."""
+        for pipeline in (config.GSTREAMER_PIPELINE, config.GSTREAMER_PIPELINE_BGR):
+            assert pipeline.endswith("appsink drop=1 max-buffers=1 sync=false")
+
     def test_servo_pan_settings(self) -> None:
         """パンサーボ設定が正しいこと."""
         assert config.SERVO_PAN_MIN <= config.SERVO_PAN_CENTER <= config.SERVO_PAN_MAX
@@ -26,11 +31,16 @@ class TestConfig:
         assert config.SERVO_TILT_MIN >= 0
         assert config.SERVO_TILT_MAX <= 180
 
+    def test_servo_min_step(self) -> None:
+        """サーボの最小ステップが正しいこと."""
+        assert config.SERVO_MIN_STEP >= 0.0
+
     def test_pid_settings(self) -> None:
         """PID設定が正しいこと."""
         assert config.PID_KP >= 0
         assert config.PID_KI >= 0
         assert config.PID_KD >= 0
+        assert config.PID_OUTPUT_LIMIT > 0
 
     def test_deadzone_settings(self) -> None:
         """デッドゾーン設定が正しいこと."""
@@ -47,3 +57,26 @@ class TestConfig:
         assert config.DETECTION_MIN_NEIGHBORS > 0
         assert len(config.DETECTION_MIN_SIZE) == 2
         assert all(s > 0 for s in config.DETECTION_MIN_SIZE)
+        assert len(config.DETECTION_MAX_SIZE) == 2
+        assert all(
+            mx >= mn
+            for mx, mn in zip(config.DETECTION_MAX_SIZE, config.DETECTION_MIN_SIZE, strict=True)
+        )
+        assert config.DETECTION_DOWNSCALE >= 1.0
+        assert config.DETECTION_STRIDE >= 1
+        assert config.ROI_MARGIN >= 0.0
+        assert config.ROI_MAX_MISSES >= 1
+
+    def test_detector_settings(self) -> None:
+        """顔検出器の設定が正しいこと."""
+        assert config.DETECTOR in ("cascade", "yunet", "dlib")
+        assert 0.0 <= config.YUNET_SCORE_THRESHOLD <= 1.0
+        assert 0.0 <= config.YUNET_NMS_THRESHOLD <= 1.0
+        assert config.DLIB_UPSAMPLE >= 0
+
+    def test_thread_settings(self) -> None:
+        """スレッド・CPU設定が正しいこと."""
+        assert config.OPENCV_NUM_THREADS >= 1
+        if config.DETECTOR_CPU_AFFINITY:
+            # コア0はメインスレッド用に空けておく
+            assert 0 not in config.DETECTOR_CPU_AFFINITY
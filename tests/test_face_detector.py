@@ -0,0 +1,330 @@
+"""FaceDetectorのテスト."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import config
+import numpy as np
+import pytest
+
+from src.face_detector import (
+    BaseFaceDetector,
+    FaceDetector,
+    FaceDetectorDlib,
+    FaceDetectorYuNet,
+    _find_cascade,
+    create_face_detector,
+)
+
+
+class TestBaseFaceDetector:
+    """BaseFaceDetectorのテスト."""
+
+    def test_abstract(self) -> None:
+        """_detect_ndarrayを実装しないとインスタンス化できないこと."""
+        with pytest.raises(TypeError):
+            BaseFaceDetector()  # type: ignore[abstract]
+
+
+class TestFaceDetector:
+    """FaceDetectorのテスト（カスケードはモック）."""
+
+    @pytest.fixture
+    def frame(self) -> np.ndarray:
+        """テスト用の黒画像フレーム."""
+        return np.zeros((480, 640, 3), dtype=np.uint8)
+
+    @pytest.fixture
+    def detector(self) -> FaceDetector:
+        """カスケードをモックに差し替えた検出器."""
+        detector = FaceDetector(detect_scale=2.0)
+        detector.face_cascade = MagicMock()
+        detector.face_cascade.detectMultiScale.return_value = ()
+        return detector
+
+    def test_init_default_scale(self) -> None:
+        """デフォルトの縮小率がconfigの値であること."""
+        detector = FaceDetector()
+        assert detector.detect_scale == config.DETECTION_DOWNSCALE
+
+    def test_init_rejects_upscale(self) -> None:
+        """縮小率が1.0未満の場合はValueErrorになること."""
+        with pytest.raises(ValueError):
+            FaceDetector(detect_scale=0.5)
+
+    def test_cuda_fallback_to_cpu(self) -> None:
+        """CUDAデバイスがない場合はCPUで検出すること."""
+        detector = FaceDetector(use_cuda=True)
+        if detector.cuda_cascade is not None:
+            pytest.skip("CUDAデバイスが利用可能")
+        assert detector.face_cascade is not None
+
+    @pytest.fixture
+    def cuda(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """CUDAデバイスがある状態を模したcv2.cudaのモック."""
+        cuda = MagicMock()
+        cuda.CascadeClassifier_create.return_value.convert.return_value = np.array(
+            [[10, 20, 30, 40]], dtype=np.int32
+        )
+        monkeypatch.setattr("src.face_detector._cuda_available", lambda: True)
+        monkeypatch.setattr("src.face_detector.cv2.cuda", cuda, raising=False)
+        return cuda
+
+    def test_setup_cuda(self, cuda: MagicMock) -> None:
+        """CUDA版の分類器の最小・最大サイズが縮小率に合わせて設定されること."""
+        detector = FaceDetector(detect_scale=2.0, use_cuda=True)
+        cascade = cuda.CascadeClassifier_create.return_value
+        assert detector.cuda_cascade is cascade
+        # CPU版と同じカスケードファイルを読み込むこと
+        found = _find_cascade()
+        assert found is not None
+        cuda.CascadeClassifier_create.assert_called_once_with(found[0])
+        min_w, min_h = config.DETECTION_MIN_SIZE
+        max_w, max_h = config.DETECTION_MAX_SIZE
+        cascade.setMinObjectSize.assert_called_once_with((int(min_w / 2), int(min_h / 2)))
+        cascade.setMaxObjectSize.assert_called_once_with((int(max_w / 2), int(max_h / 2)))
+
+    def test_setup_cuda_failure(self, cuda: MagicMock) -> None:
+        """CUDA版の分類器を作れない場合はCPUで検出すること."""
+        cuda.CascadeClassifier_create.side_effect = AttributeError
+        detector = FaceDetector(use_cuda=True)
+        assert detector.cuda_cascade is None
+
+    def test_detect_with_cuda(self, cuda: MagicMock, frame: np.ndarray) -> None:
+        """CUDAで縮小画像を検出し、元の解像度の座標に戻すこと."""
+        detector = FaceDetector(detect_scale=2.0, use_cuda=True)
+        detector.face_cascade = MagicMock()
+        assert detector.detect(frame) == [(20, 40, 60, 80)]
+        gpu_frame = cuda.GpuMat.return_value
+        (small,), _ = gpu_frame.upload.call_args
+        assert small.shape == (240, 320)
+        cascade = cuda.CascadeClassifier_create.return_value
+        cascade.detectMultiScale.assert_called_once_with(gpu_frame)
+        cascade.convert.assert_called_once_with(cascade.detectMultiScale.return_value)
+        detector.face_cascade.detectMultiScale.assert_not_called()
+
+    def test_bundled_fallback_warns_once(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """設定のカスケードがない場合、同梱のHaarに切り替えた警告だけを出すこと."""
+        monkeypatch.setattr(config, "USE_LBP", True)
+        monkeypatch.setattr(config, "LBP_CASCADE_PATH", "/nonexistent/lbp.xml")
+        monkeypatch.setattr(config, "FACE_CASCADE_PATH", "/nonexistent/haar.xml")
+        with caplog.at_level(logging.WARNING):
+            detector = FaceDetector()
+        assert detector.face_cascade is not None
+        warnings = [r for r in caplog.records if r.levelno >= logging.WARNING]
+        assert len(warnings) == 1
+
+    def test_cascade_is_cached(self) -> None:
+        """カスケードが検出器間で共有されること."""
+        assert FaceDetector().face_cascade is FaceDetector().face_cascade
+
+    def test_detect_no_face(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """顔がない場合は空リストを返すこと."""
+        assert detector.detect(frame) == []
+        assert detector.detect_largest(frame) is None
+
+    def test_detect_on_downscaled_image(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """縮小画像で検出し、最小・最大サイズも縮小されること."""
+        detector.detect(frame)
+        args, kwargs = detector.face_cascade.detectMultiScale.call_args
+        assert args[0].shape == (240, 320)
+        min_w, min_h = config.DETECTION_MIN_SIZE
+        max_w, max_h = config.DETECTION_MAX_SIZE
+        assert kwargs["minSize"] == (min_w // 2, min_h // 2)
+        assert kwargs["maxSize"] == (max_w // 2, max_h // 2)
+
+    def test_detect_gray_frame(self, detector: FaceDetector) -> None:
+        """グレースケールのフレームをそのまま検出に使えること."""
+        gray = np.zeros((480, 640), dtype=np.uint8)
+        detector.detect(gray)
+        args, _ = detector.face_cascade.detectMultiScale.call_args
+        assert args[0].shape == (240, 320)
+
+    def test_detect_reuses_buffers(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """同じサイズのフレームではバッファが再利用されること."""
+        detector.detect(frame)
+        gray, small = detector._gray, detector._small
+        detector.detect(frame)
+        assert detector._gray is gray
+        assert detector._small is small
+        args, _ = detector.face_cascade.detectMultiScale.call_args
+        assert args[0] is small
+
+    def test_detect_rescales_rects(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """検出結果が元の解像度の座標に戻されること."""
+        detector.face_cascade.detectMultiScale.return_value = np.array([[10, 20, 30, 40]])
+        assert detector.detect(frame) == [(20, 40, 60, 80)]
+
+    def test_detect_largest(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """面積が最大の顔を返すこと."""
+        detector.face_cascade.detectMultiScale.return_value = np.array(
+            [[0, 0, 10, 10], [50, 50, 40, 30], [100, 100, 20, 20]]
+        )
+        face = detector.detect_largest(frame)
+        assert face == (100, 100, 80, 60)
+        assert all(type(v) is int for v in face)
+
+    def test_detect_in_roi_offsets_rects(self, detector: FaceDetector, frame: np.ndarray) -> None:
+        """周辺領域のみを探索し、結果をフレーム全体の座標に戻すこと."""
+        detector.face_cascade.detectMultiScale.return_value = np.array([[5, 5, 10, 10]])
+        faces = detector.detect_in_roi(frame, (200, 100, 40, 40), margin=1.0)
+
+        args, _ = detector.face_cascade.detectMultiScale.call_args
+        assert args[0].shape == (60, 60)  # 120x120の領域を1/2に縮小
+        assert faces == [(170, 70, 20, 20)]
+
+    def test_detect_in_roi_clamped_to_frame(
+        self, detector: FaceDetector, frame: np.ndarray
+    ) -> None:
+        """探索領域がフレーム外にはみ出さないこと."""
+        detector.face_cascade.detectMultiScale.return_value = np.array([[0, 0, 10, 10]])
+        faces = detector.detect_in_roi(frame, (600, 0, 40, 40), margin=1.0)
+
+        args, _ = detector.face_cascade.detectMultiScale.call_args
+        assert args[0].shape == (40, 40)  # x: 560-640, y: 0-80
+        assert faces == [(560, 0, 20, 20)]
+
+    def test_get_face_center(self, detector: FaceDetector) -> None:
+        """顔の中心座標が計算できること."""
+        assert detector.get_face_center((100, 50, 40, 60)) == (120, 80)
+
+
+class TestFaceDetectorYuNet:
+    """FaceDetectorYuNetのテスト（モデルはモック）."""
+
+    @pytest.fixture
+    def model(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """モックYuNetモデル."""
+        model = MagicMock()
+        model.detect.return_value = (1, None)
+        factory = MagicMock()
+        factory.create.return_value = model
+        monkeypatch.setattr("src.face_detector.cv2.FaceDetectorYN", factory)
+        return model
+
+    def test_missing_model(self) -> None:
+        """モデルが読み込めない場合はRuntimeErrorになること."""
+        with pytest.raises(RuntimeError):
+            FaceDetectorYuNet(model_path="/nonexistent/yunet.onnx")
+
+    @pytest.mark.usefixtures("model")
+    def test_detect_no_face(self) -> None:
+        """顔がない場合はNoneを返すこと."""
+        detector = FaceDetectorYuNet()
+        assert detector.detect_largest(np.zeros((480, 640, 3), dtype=np.uint8)) is None
+
+    def test_detect_gray_frame(self, model: MagicMock) -> None:
+        """グレースケールのフレームはBGRに変換して渡されること."""
+        detector = FaceDetectorYuNet()
+        detector.detect(np.zeros((480, 640), dtype=np.uint8))
+        args, _ = model.detect.call_args
+        assert args[0].shape == (480, 640, 3)
+
+    def test_detect_largest(self, model: MagicMock) -> None:
+        """面積が最大の顔を返すこと."""
+        faces = np.zeros((2, 15), dtype=np.float32)
+        faces[0, :4] = (10.5, 20.5, 30.0, 30.0)
+        faces[1, :4] = (100.0, 50.0, 60.0, 80.0)
+        model.detect.return_value = (1, faces)
+        detector = FaceDetectorYuNet()
+        assert detector.detect_largest(np.zeros((480, 640, 3), dtype=np.uint8)) == (100, 50, 60, 80)
+
+    def test_input_size_follows_frame(self, model: MagicMock) -> None:
+        """フレームサイズが変わったら入力サイズを更新すること."""
+        detector = FaceDetectorYuNet()
+        detector.detect(np.zeros((120, 160, 3), dtype=np.uint8))
+        model.setInputSize.assert_called_once_with((160, 120))
+
+    def test_roi_uses_full_frame(self, model: MagicMock) -> None:
+        """前回の顔の周辺探索でもフレーム全体で検出し、入力サイズを変えないこと."""
+        detector = FaceDetectorYuNet()
+        frame = np.zeros((config.CAMERA_HEIGHT, config.CAMERA_WIDTH, 3), dtype=np.uint8)
+        detector.detect_largest(frame, prev_rect=(100, 100, 50, 50))
+        detector.detect_largest(frame, prev_rect=(200, 150, 80, 80))
+        model.setInputSize.assert_not_called()
+        args, _ = model.detect.call_args
+        assert args[0] is frame
+
+
+class TestFaceDetectorDlib:
+    """FaceDetectorDlibのテスト（dlibはモック）."""
+
+    @pytest.fixture
+    def hog(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """モックHOG顔検出器."""
+        hog = MagicMock(return_value=[])
+        dlib = MagicMock()
+        dlib.get_frontal_face_detector.return_value = hog
+        monkeypatch.setattr("src.face_detector.dlib", dlib)
+        monkeypatch.setattr("src.face_detector.DLIB_AVAILABLE", True)
+        return hog
+
+    @staticmethod
+    def make_rect(x: int, y: int, w: int, h: int) -> MagicMock:
+        """dlib.rectangle相当のモック."""
+        rect = MagicMock()
+        rect.left.return_value = x
+        rect.top.return_value = y
+        rect.width.return_value = w
+        rect.height.return_value = h
+        return rect
+
+    def test_dlib_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """dlibがない場合はRuntimeErrorになること."""
+        monkeypatch.setattr("src.face_detector.DLIB_AVAILABLE", False)
+        with pytest.raises(RuntimeError):
+            FaceDetectorDlib()
+
+    @pytest.mark.usefixtures("hog")
+    def test_detect_no_face(self) -> None:
+        """顔がない場合はNoneを返すこと."""
+        detector = FaceDetectorDlib()
+        assert detector.detect_largest(np.zeros((480, 640), dtype=np.uint8)) is None
+
+    def test_detect_bgr_frame(self, hog: MagicMock) -> None:
+        """BGRのフレームはグレースケールに変換して渡されること."""
+        detector = FaceDetectorDlib(upsample=1)
+        detector.detect(np.zeros((480, 640, 3), dtype=np.uint8))
+        args, _ = hog.call_args
+        assert args[0].shape == (480, 640)
+        assert args[1] == 1
+
+    def test_detect_roi_contiguous(self, hog: MagicMock) -> None:
+        """切り出したROIは連続したメモリで渡されること."""
+        detector = FaceDetectorDlib()
+        frame = np.zeros((480, 640), dtype=np.uint8)
+        detector.detect_largest(frame, (200, 200, 50, 50))
+        args, _ = hog.call_args
+        assert args[0].flags["C_CONTIGUOUS"]
+
+    def test_detect_largest(self, hog: MagicMock) -> None:
+        """dlibの矩形を (x, y, w, h) に変換し、面積が最大の顔を返すこと."""
+        hog.return_value = [self.make_rect(10, 20, 30, 30), self.make_rect(100, 50, 60, 80)]
+        detector = FaceDetectorDlib()
+        assert detector.detect_largest(np.zeros((480, 640), dtype=np.uint8)) == (100, 50, 60, 80)
+
+
+class TestCreateFaceDetector:
+    """create_face_detectorのテスト."""
+
+    def test_cascade(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """cascade指定でFaceDetectorを作成すること."""
+        monkeypatch.setattr(config, "DETECTOR", "cascade")
+        assert isinstance(create_face_detector(), FaceDetector)
+
+    def test_dlib(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """dlib指定でFaceDetectorDlibを作成すること."""
+        monkeypatch.setattr("src.face_detector.dlib", MagicMock())
+        monkeypatch.setattr("src.face_detector.DLIB_AVAILABLE", True)
+        monkeypatch.setattr(config, "DETECTOR", "dlib")
+        assert isinstance(create_face_detector(), FaceDetectorDlib)
+
+    def test_unknown(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """未対応の指定はValueErrorになること."""
+        monkeypatch.setattr(config, "DETECTOR", "unknown")
+        with pytest.raises(ValueError):
+            create_face_detector()
@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import config
 import pytest
 
-from src.servo_controller import ServoController
+from src.servo_controller import _DUTY_LUT, ServoController
+
+
+@pytest.fixture(scope="module")
+def shared_servo() -> Iterator[ServoController]:
+    """モジュール内で共有するサーボコントローラー (セットアップは1回のみ)."""
+    controller = ServoController()
+    controller.setup()
+    yield controller
+    controller.cleanup()
 
 
 class TestServoController:
     """ServoControllerのテスト（シミュレーションモード）."""
 
     @pytest.fixture
-    def servo(self) -> ServoController:
-        """テスト用サーボコントローラー."""
-        controller = ServoController()
-        controller.setup()
-        return controller
+    def servo(self, shared_servo: ServoController) -> Iterator[ServoController]:
+        """テスト用サーボコントローラー (テストごとに中央へ戻す)."""
+        yield shared_servo
+        shared_servo.center()
 
     def test_init_default_pins(self) -> None:
         """デフォルトピンで初期化されること."""
@@ -35,41 +45,57 @@ class TestServoController:
         assert servo.pan_angle == config.SERVO_PAN_CENTER
         assert servo.tilt_angle == config.SERVO_TILT_CENTER
 
-    def test_set_pan(self, servo: ServoController) -> None:
-        """パン角度が設定できること."""
-        servo.set_pan(45)
-        assert servo.pan_angle == 45
+    @pytest.mark.parametrize(
+        ("angle", "expected"),
+        [
+            (-10, config.SERVO_PAN_MIN),
+            (200, config.SERVO_PAN_MAX),
+            (45, 45),
+            (0, 0),
+        ],
+    )
+    def test_set_pan(self, servo: ServoController, angle: float, expected: float) -> None:
+        """パン角度が設定でき、範囲外はクランプされること."""
+        servo.set_pan(angle)
+        assert servo.pan_angle == expected
+
+    @pytest.mark.parametrize(
+        ("angle", "expected"),
+        [
+            (0, config.SERVO_TILT_MIN),
+            (180, config.SERVO_TILT_MAX),
+            (60, 60),
+        ],
+    )
+    def test_set_tilt(self, servo: ServoController, angle: float, expected: float) -> None:
+        """チルト角度が設定でき、範囲外はクランプされること."""
+        servo.set_tilt(angle)
+        assert servo.tilt_angle == expected
+
+    def test_small_step_skipped(self, servo: ServoController) -> None:
+        """最小ステップ未満の変化では角度が更新されないこと."""
+        servo.set_pan(config.SERVO_PAN_CENTER + config.SERVO_MIN_STEP / 2)
+        servo.set_tilt(config.SERVO_TILT_CENTER - config.SERVO_MIN_STEP / 2)
+        assert servo.pan_angle == config.SERVO_PAN_CENTER
+        assert servo.tilt_angle == config.SERVO_TILT_CENTER
 
-    def test_set_tilt(self, servo: ServoController) -> None:
-        """チルト角度が設定できること."""
-        servo.set_tilt(60)
+    def test_set_position(self, servo: ServoController) -> None:
+        """パンとチルトを同時に設定できること."""
+        servo.set_position(45, 60)
+        assert servo.pan_angle == 45
         assert servo.tilt_angle == 60
 
-    def test_pan_clamp_min(self, servo: ServoController) -> None:
-        """パン角度が最小値でクランプされること."""
-        servo.set_pan(-10)
+    def test_set_position_clamp(self, servo: ServoController) -> None:
+        """同時設定でも角度がクランプされること."""
+        servo.set_position(-10, 200)
         assert servo.pan_angle == config.SERVO_PAN_MIN
-
-    def test_pan_clamp_max(self, servo: ServoController) -> None:
-        """パン角度が最大値でクランプされること."""
-        servo.set_pan(200)
-        assert servo.pan_angle == config.SERVO_PAN_MAX
-
-    def test_tilt_clamp_min(self, servo: ServoController) -> None:
-        """チルト角度が最小値でクランプされること."""
-        servo.set_tilt(0)
-        assert servo.tilt_angle == config.SERVO_TILT_MIN
-
-    def test_tilt_clamp_max(self, servo: ServoController) -> None:
-        """チルト角度が最大値でクランプされること."""
-        servo.set_tilt(180)
         assert servo.tilt_angle == config.SERVO_TILT_MAX
 
-    def test_set_position(self, servo: ServoController) -> None:
-        """パンとチルトを同時に設定できること."""
-        servo.set_position(45, 60)
+    def test_set_position_small_step(self, servo: ServoController) -> None:
+        """同時設定でも最小ステップ未満の軸は更新されないこと."""
+        servo.set_position(45, config.SERVO_TILT_CENTER + config.SERVO_MIN_STEP / 2)
         assert servo.pan_angle == 45
-        assert servo.tilt_angle == 60
+        assert servo.tilt_angle == config.SERVO_TILT_CENTER
 
     def test_center(self, servo: ServoController) -> None:
         """中央に戻せること."""
@@ -90,6 +116,24 @@ class TestServoController:
         assert servo._angle_to_duty(0) == 2.5
         assert servo._angle_to_duty(90) == pytest.approx(7.5)
         assert servo._angle_to_duty(180) == 12.5
+        # 0.5°刻みの角度はテーブルの値そのものを返す
+        for index in range(361):
+            assert servo._angle_to_duty(index / 2) == float(_DUTY_LUT[index])
+
+    def test_angle_to_duty_non_integer(self, servo: ServoController) -> None:
+        """刻みの間の角度は最も近い0.5°刻みの値、範囲外の角度は計算されること."""
+        assert servo._angle_to_duty(45.2) == float(_DUTY_LUT[90])
+        assert servo._angle_to_duty(45.3) == float(_DUTY_LUT[91])
+        assert servo._angle_to_duty(179.9) == 12.5
+        assert servo._angle_to_duty(-18) == pytest.approx(1.5)
+
+    def test_min_step_changes_duty(self, servo: ServoController) -> None:
+        """最小ステップ以上の角度変化ではデューティ比が必ず変わること."""
+        assert servo._angle_to_duty(90.1) != servo._angle_to_duty(89.6)
+        for tenth in range(0, 1800 - int(config.SERVO_MIN_STEP * 10)):
+            angle = tenth / 10
+            duty = servo._angle_to_duty(angle)
+            assert servo._angle_to_duty(angle + config.SERVO_MIN_STEP) != duty
 
     def test_context_manager(self) -> None:
         """コンテキストマネージャーとして使えること."""
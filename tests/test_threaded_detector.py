@@ -0,0 +1,135 @@
+"""ThreadedDetectorのテスト."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import config
+import numpy as np
+import pytest
+
+from src.threaded_detector import ThreadedDetector, set_thread_affinity
+
+
+def wait_for_result(threaded: ThreadedDetector, result_id: int, timeout: float = 2.0) -> None:
+    """指定の通し番号の結果が出るまで待つ."""
+    deadline = time.monotonic() + timeout
+    while threaded.get_latest_result()[0] < result_id:
+        if time.monotonic() > deadline:
+            pytest.fail("検出結果がタイムアウトしました")
+        time.sleep(0.001)
+
+
+class TestSetThreadAffinity:
+    """set_thread_affinityのテスト."""
+
+    def test_sets_affinity(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """呼び出し元のスレッドを指定のコアに固定すること."""
+        setaffinity = MagicMock()
+        monkeypatch.setattr(
+            "src.threaded_detector.os.sched_setaffinity", setaffinity, raising=False
+        )
+        set_thread_affinity((1, 2, 3))
+        setaffinity.assert_called_once_with(0, (1, 2, 3))
+
+    def test_none_skips(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Noneの場合は固定しないこと."""
+        setaffinity = MagicMock()
+        monkeypatch.setattr(
+            "src.threaded_detector.os.sched_setaffinity", setaffinity, raising=False
+        )
+        set_thread_affinity(None)
+        setaffinity.assert_not_called()
+
+    def test_invalid_cpu_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """存在しないコアを指定してもエラーにならないこと."""
+        setaffinity = MagicMock(side_effect=OSError("Invalid argument"))
+        monkeypatch.setattr(
+            "src.threaded_detector.os.sched_setaffinity", setaffinity, raising=False
+        )
+        set_thread_affinity((99,))
+
+
+class TestThreadedDetector:
+    """ThreadedDetectorのテスト（検出器はモック）."""
+
+    @pytest.fixture
+    def mock_detector(self) -> MagicMock:
+        """モック顔検出器."""
+        detector = MagicMock()
+        detector.detect_largest.return_value = (10, 20, 30, 40)
+        return detector
+
+    @pytest.fixture
+    def frame(self) -> np.ndarray:
+        """テスト用フレーム."""
+        return np.zeros((480, 640), dtype=np.uint8)
+
+    def test_initial_result(self, mock_detector: MagicMock) -> None:
+        """起動直後は結果がないこと."""
+        threaded = ThreadedDetector(mock_detector)
+        assert threaded.get_latest_result() == (0, None)
+        assert threaded.get_latest_face() is None
+
+    def test_submit_publishes_result(self, mock_detector: MagicMock, frame: np.ndarray) -> None:
+        """渡したフレームの検出結果が取得できること."""
+        with ThreadedDetector(mock_detector) as threaded:
+            threaded.submit(frame)
+            wait_for_result(threaded, 1)
+            assert threaded.get_latest_face() == (10, 20, 30, 40)
+        mock_detector.detect_largest.assert_called_with(frame, None)
+
+    def test_submit_overwrites_pending_frame(self, mock_detector: MagicMock) -> None:
+        """未処理のフレームは新しいフレームで上書きされること."""
+        threaded = ThreadedDetector(mock_detector)
+        old = np.zeros((4, 4), dtype=np.uint8)
+        new = np.ones((4, 4), dtype=np.uint8)
+        threaded.submit(old)
+        threaded.submit(new)
+
+        with threaded:
+            wait_for_result(threaded, 1)
+        mock_detector.detect_largest.assert_called_once_with(new, None)
+
+    def test_roi_after_detection(self, mock_detector: MagicMock, frame: np.ndarray) -> None:
+        """顔を検出したら次回は前回の顔の周辺を探索すること."""
+        threaded = ThreadedDetector(mock_detector)
+        threaded._detect(frame)
+        threaded._detect(frame)
+        mock_detector.detect_largest.assert_called_with(frame, (10, 20, 30, 40))
+
+    def test_roi_falls_back_to_full_scan(self, mock_detector: MagicMock, frame: np.ndarray) -> None:
+        """周辺探索で見失い続けたら全画面探索に戻ること."""
+        threaded = ThreadedDetector(mock_detector)
+        threaded._detect(frame)
+
+        mock_detector.detect_largest.return_value = None
+        for _ in range(config.ROI_MAX_MISSES):
+            threaded._detect(frame)
+            mock_detector.detect_largest.assert_called_with(frame, (10, 20, 30, 40))
+
+        threaded._detect(frame)
+        mock_detector.detect_largest.assert_called_with(frame, None)
+
+    def test_detector_error_is_raised(self, mock_detector: MagicMock, frame: np.ndarray) -> None:
+        """検出中の例外でワーカーが止まり、結果の取得時に送出されること."""
+        mock_detector.detect_largest.side_effect = ValueError("detect failed")
+        with ThreadedDetector(mock_detector) as threaded:
+            thread = threaded._thread
+            threaded.submit(frame)
+            assert thread is not None
+            thread.join(timeout=2.0)
+            assert not thread.is_alive()
+            with pytest.raises(ValueError, match="detect failed"):
+                threaded.get_latest_result()
+            with pytest.raises(ValueError, match="detect failed"):
+                threaded.get_latest_face()
+
+    def test_stop_joins_thread(self, mock_detector: MagicMock) -> None:
+        """停止でスレッドが終了すること."""
+        threaded = ThreadedDetector(mock_detector).start()
+        thread = threaded._thread
+        threaded.stop()
+        assert thread is not None
+        assert not thread.is_alive()
@@ -5,9 +5,19 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import config
+import numpy as np
 import pytest
 
 from src.tracker import FaceTracker, PIDController, TrackerStatus
+from src.tracker_kernels import idle_step, pid_step, track_step
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_up_kernels() -> None:
+    """JITコンパイルを最初に1回だけ済ませ、初回呼び出しの遅延をテストに含めない."""
+    pid_step(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+    track_step(0.0, 0.0, 0.0, 0.0, 0.0, 0.0, np.zeros(8), np.zeros(7))
+    idle_step(np.zeros(8), np.zeros(7))
 
 
 class TestPIDController:
@@ -54,23 +64,58 @@ class TestPIDController:
         pid.compute(20.0)
         pid.reset()
         assert pid.prev_error == 0
-        assert pid.integral == 0
+        assert pid.prev_error2 == 0
+        assert pid.raw_output == 0
+
+    def test_reset_bumpless(self) -> None:
+        """リセット後は前回の出力を引き継がず0から再開すること."""
+        pid = PIDController(kp=1.0, ki=0.0, kd=0.0)
+        pid.compute(10.0)
+        pid.reset()
+        assert pid.compute(3.0) == 3.0
+
+    def test_output_limit(self) -> None:
+        """制御出力が上限でクランプされること."""
+        pid = PIDController(kp=1.0, ki=0.0, kd=0.0, output_limit=5.0)
+        assert pid.compute(10.0) == 5.0
+        assert pid.compute(-10.0) == -5.0
+
+    def test_anti_windup(self) -> None:
+        """飽和中も積分が溜まらず、誤差の符号が変わればすぐに出力が下がること."""
+        pid = PIDController(kp=0.0, ki=1.0, kd=0.0, output_limit=10.0)
+        for _ in range(100):
+            pid.compute(50.0)
+        assert pid.raw_output == 10.0
+        assert pid.compute(-1.0) == 9.0
+
+    def test_saturation_keeps_sign(self) -> None:
+        """デフォルトのゲインで飽和中に誤差が減っても出力の符号が反転しないこと."""
+        pid = PIDController()
+        assert pid.compute(300.0) == config.PID_OUTPUT_LIMIT
+        assert pid.compute(250.0) == config.PID_OUTPUT_LIMIT
+
+
+@pytest.fixture(scope="class")
+def mock_servo() -> MagicMock:
+    """モックサーボコントローラー (テストクラス内で共有)."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="class")
+def tracker(mock_servo: MagicMock) -> FaceTracker:
+    """テスト用トラッカー (テストクラス内で共有)."""
+    return FaceTracker(mock_servo, frame_width=640, frame_height=480)
 
 
 class TestFaceTracker:
     """FaceTrackerのテスト."""
 
-    @pytest.fixture
-    def mock_servo(self) -> MagicMock:
-        """モックサーボコントローラー."""
-        servo = MagicMock()
-        servo.get_position.return_value = (90.0, 90.0)
-        return servo
-
-    @pytest.fixture
-    def tracker(self, mock_servo: MagicMock) -> FaceTracker:
-        """テスト用トラッカー."""
-        return FaceTracker(mock_servo, frame_width=640, frame_height=480)
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_servo: MagicMock, tracker: FaceTracker) -> None:
+        """共有しているモックとトラッカーをテストごとに初期状態へ戻す."""
+        mock_servo.reset_mock()
+        mock_servo.get_position.return_value = (90.0, 90.0)
+        tracker.reset()
 
     def test_init(self, tracker: FaceTracker) -> None:
         """正しく初期化されること."""
@@ -87,12 +132,39 @@ class TestFaceTracker:
         assert tracker.tracking is True
         assert tracker.lost_count == 0
 
+    def test_update_in_deadzone_skips_servo(
+        self, tracker: FaceTracker, mock_servo: MagicMock
+    ) -> None:
+        """両軸ともデッドゾーン内ならサーボに書き込まず、誤差0としてPIDの履歴を進めること."""
+        tracker.update((220, 240))
+        smooth = tracker.smooth.copy()
+        mock_servo.reset_mock()
+
+        tracker.update((320 + config.DEADZONE_X - 1, 240 - config.DEADZONE_Y + 1))
+        mock_servo.get_position.assert_not_called()
+        mock_servo.set_position.assert_not_called()
+        assert tracker._state[0:4].tolist() == [0.0, 0.0, 100.0, 0.0]
+        assert (tracker.smooth == smooth).all()
+        assert tracker.tracking is True
+
     def test_update_with_face_off_center(self, tracker: FaceTracker, mock_servo: MagicMock) -> None:
         """顔が中央からずれているとき、サーボが動くこと."""
         tracker.update((100, 100))
         mock_servo.set_position.assert_called()
         assert tracker.tracking is True
 
+    def test_shrinking_error_keeps_direction(
+        self, tracker: FaceTracker, mock_servo: MagicMock
+    ) -> None:
+        """顔が左にあり誤差が縮んでいく間、パンの補正が常に顔の方向であること."""
+        pan = 90.0
+        for error in (250, 200, 150, 100):
+            mock_servo.get_position.return_value = (pan, 90.0)
+            tracker.update((tracker.center_x - error, tracker.center_y))
+            target_pan, _ = mock_servo.set_position.call_args.args
+            assert target_pan > pan
+            pan = target_pan
+
     def test_update_with_no_face(self, tracker: FaceTracker) -> None:
         """顔が検出されないとき、lost_countが増えること."""
         tracker.update(None)
@@ -100,10 +172,12 @@ class TestFaceTracker:
         tracker.update(None)
         assert tracker.lost_count == 2
 
-    def test_face_lost_returns_to_center(self, tracker: FaceTracker, mock_servo: MagicMock) -> None:
+    def test_face_lost_returns_to_center(
+        self, tracker: FaceTracker, mock_servo: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """一定時間顔を見失ったら中央に戻ること."""
         tracker.tracking = True
-        tracker.lost_threshold = 3  # テスト用に小さく
+        monkeypatch.setattr(tracker, "lost_threshold", 3)  # テスト用に小さく
 
         for _ in range(4):
             tracker.update(None)
@@ -111,6 +185,16 @@ class TestFaceTracker:
         mock_servo.center.assert_called()
         assert not tracker.tracking
 
+    def test_reset(self, tracker: FaceTracker) -> None:
+        """リセットで初期化直後と同じ状態に戻ること."""
+        fresh = FaceTracker(MagicMock(), frame_width=640, frame_height=480)
+        tracker.update((100, 100))
+        tracker.update(None)
+        tracker.reset()
+        assert (tracker.tracking, tracker.lost_count) == (fresh.tracking, fresh.lost_count)
+        assert tracker._state.tolist() == fresh._state.tolist()
+        assert tracker._status == fresh._status
+
     def test_is_tracking(self, tracker: FaceTracker) -> None:
         """追跡状態の取得."""
         assert tracker.is_tracking() is False
@@ -125,3 +209,11 @@ class TestFaceTracker:
         assert status.pan == 90.0
         assert status.tilt == 90.0
         assert status.lost_count == 0
+
+    def test_get_status_reused(self, tracker: FaceTracker, mock_servo: MagicMock) -> None:
+        """ステータスは同じオブジェクトが最新の値で更新されること."""
+        status = tracker.get_status()
+        tracker.update(None)
+        mock_servo.get_position.return_value = (45.0, 60.0)
+        assert tracker.get_status() is status
+        assert (status.pan, status.tilt, status.lost_count) == (45.0, 60.0, 1)
@@ -0,0 +1,113 @@
+"""追尾計算カーネルのテスト."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.tracker_kernels import idle_step, pid_step, track_step
+
+
+def run_step(
+    err_x: float,
+    err_y: float,
+    *,
+    kp: float = 1.0,
+    ki: float = 0.0,
+    kd: float = 0.0,
+    alpha: float = 1.0,
+    deadzone: float = 0.0,
+    limit: float = 1000.0,
+) -> tuple[tuple[float, float], np.ndarray]:
+    """状態を初期値 (現在位置・スムージング済み角度は90°) にしてtrack_stepを1回実行.
+
+    Returns:
+        tuple: ((目標パン角度, 目標チルト角度), 更新後の状態)
+    """
+    state = np.zeros(8)
+    state[6:8] = 90.0
+    params = np.array([kp, ki, kd, limit, alpha, deadzone, deadzone])
+    # 画面中心を (320, 240) として、誤差が (err_x, err_y) になる顔の位置を渡す
+    target = track_step(320.0 - err_x, 240.0 + err_y, 320.0, 240.0, 90.0, 90.0, state, params)
+    return target, state
+
+
+class TestPidStep:
+    """pid_stepのテスト."""
+
+    def test_output(self) -> None:
+        """前回の出力に比例・積分・微分の増分が加算されること."""
+        output, _, _, _ = pid_step(10.0, 4.0, 1.0, 2.0, 1.0, 0.5, 0.25, 100.0)
+        # 2 + 1.0 * (10 - 4) + 0.5 * 10 + 0.25 * (10 - 2 * 4 + 1)
+        assert output == pytest.approx(13.75)
+
+    def test_state_update(self) -> None:
+        """今回の誤差と前回の誤差が返ること."""
+        _, _, prev_error, prev_error2 = pid_step(10.0, 4.0, 1.0, 2.0, 1.0, 0.5, 0.25, 100.0)
+        assert (prev_error, prev_error2) == (10.0, 4.0)
+
+    def test_limit(self) -> None:
+        """出力が上限でクランプされ、制限前の出力は保持されること."""
+        output, raw_output, _, _ = pid_step(-50.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 30.0)
+        assert output == -30.0
+        assert raw_output == -50.0
+
+    def test_saturation_keeps_sign(self) -> None:
+        """飽和中に誤差が減っても出力の符号が反転しないこと."""
+        output, raw_output, prev_error, _ = pid_step(300.0, 0.0, 0.0, 0.0, 0.5, 0.0, 0.1, 30.0)
+        output, *_ = pid_step(250.0, prev_error, 0.0, raw_output, 0.5, 0.0, 0.1, 30.0)
+        assert output == 30.0
+
+
+class TestTrackStep:
+    """track_stepのテスト."""
+
+    def test_proportional(self) -> None:
+        """比例制御の調整量が現在位置に加算されること."""
+        target, _ = run_step(10.0, -5.0)
+        assert target == pytest.approx((100.0, 85.0))
+
+    def test_error_sign(self) -> None:
+        """顔が左・上にあるとき誤差が正になること."""
+        _, state = run_step(10.0, -5.0)
+        assert state[0:2].tolist() == [10.0, -5.0]
+
+    def test_state_update(self) -> None:
+        """PID出力と誤差の履歴が更新されること."""
+        target, state = run_step(10.0, -5.0)
+        assert state[0:2].tolist() == [10.0, -5.0]
+        assert state[2:4].tolist() == [0.0, 0.0]
+        assert state[4:6].tolist() == [10.0, -5.0]
+        assert tuple(state[6:8]) == target
+
+    def test_deadzone(self) -> None:
+        """デッドゾーン内の誤差は0として扱われること."""
+        target, state = run_step(5.0, 5.0, deadzone=10.0)
+        assert target == (90.0, 90.0)
+        assert not state[0:6].any()
+
+    def test_limit(self) -> None:
+        """PID出力が上限でクランプされること."""
+        (pan, _), _ = run_step(100.0, 0.0, limit=30.0)
+        assert pan == pytest.approx(120.0)
+
+    def test_smoothing(self) -> None:
+        """スムージング係数の割合だけ目標に近づくこと."""
+        (pan, _), _ = run_step(10.0, 0.0, alpha=0.5)
+        assert pan == pytest.approx(95.0)
+
+
+class TestIdleStep:
+    """idle_stepのテスト."""
+
+    def test_matches_zero_error(self) -> None:
+        """誤差0のtrack_stepと同じだけPIDの履歴を進め、スムージング済み角度は変えないこと."""
+        _, state = run_step(100.0, -20.0, kd=0.5)
+        expected = state.copy()
+        params = np.array([1.0, 0.0, 0.5, 1000.0, 1.0, 0.0, 0.0])
+        track_step(320.0, 240.0, 320.0, 240.0, 90.0, 90.0, expected, params)
+
+        smooth = state[6:8].copy()
+        idle_step(state, params)
+        assert state[0:6].tolist() == expected[0:6].tolist()
+        assert state[6:8].tolist() == smooth.tolist()